@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Anthropic Messages API, plus a request-shape check.
+
+The stand-in answers POST /v1/messages (streaming or not) with the fake
+backend's canned roundups and bios, and reports prompt-cache usage the way
+the API does: the first request with a given cached prefix writes it, later
+ones read it. Every request body is kept so it can be inspected.
+
+    # Check the roundup request through the real SDK
+    python .github/scripts/anthropic_standin.py check
+
+    # Serve it and point the generator at it
+    python .github/scripts/anthropic_standin.py serve --port 8766
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8766 ANTHROPIC_API_KEY=test python .github/scripts/generate_article.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from llm_backend import FakeBackend
+
+MIN_CACHEABLE_TOKENS = 1024  # prefixes shorter than this are never cached (Sonnet)
+
+
+def _tokens(value):
+    return len(json.dumps(value, ensure_ascii=False)) // 4
+
+
+def _split_cached_prefix(body):
+    """Return (prefix blocks up to the last cache_control breakpoint, the rest)."""
+    system = body.get('system') or []
+    if isinstance(system, str):
+        system = [{'type': 'text', 'text': system}]
+    blocks = list(system) + [m for m in body.get('messages', [])]
+    last = max((i for i, b in enumerate(blocks) if isinstance(b, dict) and b.get('cache_control')), default=-1)
+    return blocks[:last + 1], blocks[last + 1:]
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if self.path.split('?')[0] != '/v1/messages':
+            self.send_error(404)
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        server = self.server
+        with server.lock:
+            server.requests.append(body)
+
+        prefix, rest = _split_cached_prefix(body)
+        prefix_tokens = _tokens(prefix) if prefix else 0
+        usage = {'input_tokens': _tokens(rest), 'cache_read_input_tokens': 0, 'cache_creation_input_tokens': 0}
+        if prefix_tokens >= MIN_CACHEABLE_TOKENS:
+            key = hashlib.sha256(json.dumps(prefix, sort_keys=True).encode('utf-8')).hexdigest()
+            with server.lock:
+                seen = key in server.cached_prefixes
+                server.cached_prefixes.add(key)
+            usage['cache_read_input_tokens' if seen else 'cache_creation_input_tokens'] = prefix_tokens
+        else:
+            usage['input_tokens'] += prefix_tokens
+
+        text = server.backend.create(body).text
+        usage['output_tokens'] = len(text) // 4
+        message = {
+            'id': f"msg_standin_{len(server.requests)}", 'type': 'message', 'role': 'assistant',
+            'model': body.get('model'), 'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn', 'stop_sequence': None, 'usage': usage,
+        }
+        if body.get('stream'):
+            self._stream(message, text)
+        else:
+            payload = json.dumps(message).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    def _stream(self, message, text):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        def event(kind, data):
+            self.wfile.write(f"event: {kind}\ndata: {json.dumps({'type': kind, **data})}\n\n".encode('utf-8'))
+
+        start = dict(message, content=[], stop_reason=None, usage=dict(message['usage'], output_tokens=1))
+        event('message_start', {'message': start})
+        event('content_block_start', {'index': 0, 'content_block': {'type': 'text', 'text': ''}})
+        for i in range(0, len(text), 64):
+            event('content_block_delta', {'index': 0, 'delta': {'type': 'text_delta', 'text': text[i:i + 64]}})
+        event('content_block_stop', {'index': 0})
+        event('message_delta', {'delta': {'stop_reason': message['stop_reason'], 'stop_sequence': None},
+                                'usage': {'output_tokens': message['usage']['output_tokens']}})
+        event('message_stop', {})
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_standin(port=0):
+    """Start the stand-in on a background thread; returns (server, base_url)."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), StandinHandler)
+    server.daemon_threads = True
+    server.backend = FakeBackend()
+    server.requests = []
+    server.cached_prefixes = set()
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def check(args):
+    """Send two roundup requests through the SDK and check what reached the API."""
+    server, base_url = start_standin()
+    os.environ.update({'ANTHROPIC_BASE_URL': base_url, 'ANTHROPIC_API_KEY': 'standin',
+                       'LLM_BACKEND': 'anthropic', 'LLM_CACHE': '0', 'LLM_LEDGER': '0'})
+    import generate_article
+
+    days = [
+        [{'title': f"Day one story {i}", 'url': f"https://example.com/one/{i}", 'source': 'Reuters',
+          'date': 'Mon, 01 Jun 2026 09:00:00 GMT'} for i in range(10)],
+        [{'title': f"Day two story {i}", 'url': f"https://example.com/two/{i}", 'source': 'BBC News',
+          'date': 'Tue, 02 Jun 2026 09:00:00 GMT'} for i in range(10)],
+    ]
+    results = [generate_article.generate_roundup(articles) for articles in days]
+    server.shutdown()
+    server.server_close()
+
+    first, second = server.requests[0], server.requests[-1]
+    system = first.get('system')
+    user = first['messages'][0]['content']
+    checks = [
+        ("both requests produced a roundup", all(results)),
+        ("responses were streamed", all(r.get('stream') for r in server.requests)),
+        ("system prompt is a list of text blocks", isinstance(system, list) and all(b.get('type') == 'text' for b in system)),
+        ("last system block is marked cache_control: ephemeral",
+         isinstance(system, list) and system[-1].get('cache_control') == {'type': 'ephemeral'}),
+        ("cached prefix holds the static rules", 'OUTPUT FORMAT' in system[-1]['text'] and 'DIVERSITY RULES' in system[-1]['text']),
+        ("cached prefix is identical across days", first.get('system') == second.get('system')),
+        ("cached prefix has no articles or dates", not any(a['url'] in json.dumps(system) for day in days for a in day)
+         and "TODAY'S DATE" not in json.dumps(system)),
+        ("articles and date come after the prefix, in the user message",
+         isinstance(user, str) and days[0][0]['url'] in user and "TODAY'S DATE" in user),
+        (f"prefix is at least {MIN_CACHEABLE_TOKENS} tokens (estimated) so it can be cached",
+         _tokens(system) >= MIN_CACHEABLE_TOKENS),
+        ("second request read the prefix from cache", generate_article.llm_usage.get('cache_read_input_tokens', 0) > 0),
+    ]
+    failed = 0
+    for label, ok in checks:
+        print(f"{'PASS' if ok else 'FAIL'}  {label}")
+        failed += not ok
+    usage = generate_article.llm_usage
+    print(f"Input tokens: {usage.get('cache_read_input_tokens', 0)} cached, "
+          f"{usage.get('cache_creation_input_tokens', 0)} written to cache, {usage.get('input_tokens', 0)} uncached")
+    return 1 if failed else 0
+
+
+def serve(args):
+    server, base_url = start_standin(args.port)
+    print(f"Anthropic stand-in on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('check', help='check the shape of the roundup request')
+    p.set_defaults(func=check)
+    p = sub.add_parser('serve', help='serve the stand-in over HTTP')
+    p.add_argument('--port', type=int, default=8766)
+    p.set_defaults(func=serve)
+    args = parser.parse_args()
+    sys.exit(args.func(args) or 0)
+
+
+if __name__ == '__main__':
+    main()
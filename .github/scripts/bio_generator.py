@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Generate bios for new names concurrently.
+
+Each bio is an independent Claude call that spends almost all of its time
+waiting on the API, so a day with eight new names used to pay eight round
+trips back to back. generate_bios() runs them on a bounded thread pool and
+hands each result to a callback on the calling thread as soon as it
+arrives, so successes are saved even if a later call fails or the run is
+killed. A failed name gets the standard fallback text.
+
+The Message Batches API is not used: batch results can take far longer
+than the workflow is willing to wait.
+
+A fake backend with configurable latency and error rate allows offline
+throughput checks:
+
+    python .github/scripts/bio_generator.py bench --names 8 --latency 2 --workers 1,4,8
+"""
+
+import argparse
+import random
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+BIO_MAX_TOKENS = 300
+BIO_MAX_CHARS = 1200  # 2-4 sentences; longer means the model ignored the brief
+
+
+def bio_prompt(name):
+    return f"""Write a 2-4 sentence factual bio about {name}'s documented connection to Jeffrey Epstein for a news aggregation website.
+Only include publicly verified information from court documents, flight logs, or credible news reporting.
+Use hedging language where appropriate ("according to documents," "has denied," "allegedly").
+Do NOT speculate. If the connection is minimal or unclear, say so.
+Return ONLY the bio text, no quotes or labels."""
+
+
+def _plain(text):
+    """Lowercase text without diacritics, so 'Rinkēvičs' matches 'Rinkevics'."""
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii').lower()
+
+
+def bio_problem(name, text):
+    """Return why a generated bio can't be published, or None if it is fine."""
+    if not text:
+        return "empty"
+    if text.startswith(("I ", "I'm", "I'd", "Sorry", "As an AI")):
+        return "reads as a refusal"
+    # Short words ("Al", "Le") match anywhere; use the whole name if every word is short
+    words = [word for word in name.split() if len(word) > 2] or [name]
+    if not any(_plain(word) in _plain(text) for word in words):
+        return f"does not mention {name}"
+    if len(text) > BIO_MAX_CHARS:
+        return f"longer than {BIO_MAX_CHARS} characters"
+    return None
+
+
+def fallback_bio(name):
+    return f"{name} has been referenced in documents related to the Jeffrey Epstein case. Their name appears in the Epstein Files Daily coverage."
+
+
+def generate_bios(names, complete, on_result, workers=4):
+    """Generate a bio for each name with at most `workers` calls in flight.
+
+    complete(name) returns the bio text or raises. on_result(name, text, ok)
+    is called on this thread for every name as its call finishes, with the
+    fallback text and ok=False for failures. Returns (succeeded, failed).
+    """
+    succeeded = failed = 0
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(complete, name): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                text = future.result().strip()
+                if not text:
+                    raise ValueError("empty response")
+            except Exception as e:
+                print(f"  Failed to generate bio for {name}: {e}")
+                on_result(name, fallback_bio(name), False)
+                failed += 1
+                continue
+            print(f"  Generated bio for {name}")
+            on_result(name, text, True)
+            succeeded += 1
+    print(f"Generated {succeeded}/{len(names)} bios in {time.monotonic() - started:.1f}s "
+          f"({workers} workers, {failed} fell back)")
+    return succeeded, failed
+
+
+class FakeBioBackend:
+    """Stand-in for the Claude call: sleeps for a latency and sometimes fails."""
+
+    def __init__(self, latency=2.0, jitter=0.5, error_rate=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def __call__(self, name):
+        with self.lock:
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            fail = self.rng.random() < self.error_rate
+        time.sleep(delay)
+        if fail:
+            raise RuntimeError("simulated API error")
+        return f"{name} is a fake bio written after {delay:.2f}s."
+
+
+def cmd_bench(args):
+    names = [f"Person {i + 1}" for i in range(args.names)]
+    print(f"{'workers':>8} {'seconds':>8} {'bios/s':>7} {'failed':>7}")
+    for workers in [int(w) for w in args.workers.split(',')]:
+        backend = FakeBioBackend(args.latency, args.jitter, args.error_rate, args.seed)
+        started = time.monotonic()
+        _, failed = generate_bios(names, backend, lambda *a: None, workers=workers)
+        elapsed = time.monotonic() - started
+        print(f"{workers:>8} {elapsed:>8.2f} {len(names) / elapsed:>7.2f} {failed:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    bench = sub.add_parser('bench', help='compare worker counts against the fake backend')
+    bench.add_argument('--names', type=int, default=8)
+    bench.add_argument('--latency', type=float, default=2.0, help='seconds per fake call')
+    bench.add_argument('--jitter', type=float, default=0.5)
+    bench.add_argument('--error-rate', type=float, default=0.0)
+    bench.add_argument('--workers', default='1,4,8', help='comma-separated worker counts')
+    bench.add_argument('--seed', type=int, default=0)
+    bench.set_defaults(func=cmd_bench)
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Bios for name pages: an append-only log plus a compacted snapshot.
+
+name-bios.json stays a plain {slug: bio} map, because the name pages, the
+relevance scorer and the name tagger all read it. Saving a bio used to
+rewrite the whole of that file. Now each bio is one line appended to
+name-bios.jsonl, together with when it was generated, by which model (for
+a fallback, the last model tried), whether it is a real bio ('ok') or the
+fallback text ('fallback') and how many times it was attempted. Lookups
+go through an in-memory dict, so they cost O(1). The snapshot is written
+once at the end of a run. The log is rewritten to one line per slug only
+after enough superseded lines pile up.
+
+A failed bio used to keep the fallback text forever. refresh() retries
+fallbacks, and bios older than the maximum age, in small batches. A retry
+that fails only counts the attempt, so the entry stays due. Healthy
+entries are never touched. The daily run refreshes one batch:
+
+    python .github/scripts/bio_store.py stats
+    python .github/scripts/bio_store.py refresh [--batch 5] [--max-age-days 180]
+    python .github/scripts/bio_store.py compact
+"""
+
+import argparse
+import json
+import time
+
+from bio_generator import fallback_bio, generate_bios
+from fileutil import write_atomic
+
+FALLBACK_SUFFIX = fallback_bio('').strip()
+COMPACT_MIN_SUPERSEDED = 50  # rewrite the log once this many lines are stale
+
+
+def _name_from_slug(slug):
+    return ' '.join(w.capitalize() for w in slug.split('-'))
+
+
+class BioStore:
+    def __init__(self, snapshot_path='name-bios.json', log_path='name-bios.jsonl'):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.entries = {}
+        self.logged = set()  # slugs with at least one line in the log
+        self.log_lines = 0
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            snapshot = {}
+        # Entries from before the log existed have no metadata
+        for slug, text in snapshot.items():
+            self.entries[slug] = {
+                'slug': slug, 'name': _name_from_slug(slug), 'text': text, 'model': None, 'generated_at': None,
+                'status': 'fallback' if text.endswith(FALLBACK_SUFFIX) else 'ok', 'attempts': 1,
+            }
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut short by a crash
+                    self.entries[record['slug']] = record
+                    self.logged.add(record['slug'])
+                    self.log_lines += 1
+        except OSError:
+            pass
+        # The log wins over a snapshot written before a crash
+        self.dirty = any(snapshot.get(slug) != e['text'] for slug, e in self.entries.items())
+
+    def __contains__(self, slug):
+        return slug in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, slug):
+        entry = self.entries.get(slug)
+        return entry['text'] if entry else None
+
+    def put(self, slug, name, text, model, status='ok'):
+        """Record a bio by appending one line to the log.
+
+        model is the one the router actually used (for a fallback, the last
+        one tried), or None if the bio came from somewhere else.
+        """
+        previous = self.entries.get(slug)
+        record = {
+            'slug': slug, 'name': name, 'text': text, 'model': model, 'generated_at': int(time.time()),
+            'status': status, 'attempts': (previous['attempts'] + 1) if previous else 1,
+        }
+        self._append(record)
+        self.dirty = True
+        return record
+
+    def record_failure(self, slug):
+        """Count a failed retry, keeping the entry's text, model and age so it stays due."""
+        entry = self.entries[slug]
+        record = {**entry, 'attempts': entry['attempts'] + 1}
+        self._append(record)
+        return record
+
+    def _append(self, record):
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.entries[record['slug']] = record
+        self.logged.add(record['slug'])
+        self.log_lines += 1
+
+    def needs_refresh(self, max_age_days):
+        """Slugs whose bio is the fallback text or older than max_age_days, oldest first."""
+        cutoff = time.time() - max_age_days * 86400
+        due = [e for e in self.entries.values()
+               if e['status'] != 'ok' or (e['generated_at'] is not None and e['generated_at'] < cutoff)]
+        # Fewest attempts first, so one name that keeps failing can't hog every batch
+        due.sort(key=lambda e: (e['attempts'], e['generated_at'] or 0))
+        return [e['slug'] for e in due]
+
+    def save_snapshot(self):
+        """Rewrite name-bios.json if anything changed since it was last written."""
+        if not self.dirty:
+            return False
+        snapshot = {slug: e['text'] for slug, e in self.entries.items()}
+        write_atomic(self.snapshot_path, json.dumps(snapshot, indent=2))
+        self.dirty = False
+        return True
+
+    def compact(self, force=False):
+        """Rewrite the log with one line per slug once enough lines are superseded."""
+        logged = [self.entries[slug] for slug in self.logged]
+        superseded = self.log_lines - len(logged)
+        if not force and superseded < COMPACT_MIN_SUPERSEDED:
+            return 0
+        write_atomic(self.log_path, ''.join(json.dumps(e, ensure_ascii=False) + '\n'
+                                            for e in sorted(logged, key=lambda e: e['slug'])))
+        self.log_lines = len(logged)
+        return superseded
+
+    def stats(self):
+        counts = {}
+        for e in self.entries.values():
+            counts[e['status']] = counts.get(e['status'], 0) + 1
+        return {'bios': len(self.entries), 'log_lines': self.log_lines, **counts}
+
+
+def refresh(store, complete, model_of, batch_size=5, max_age_days=180, names=None, workers=4):
+    """Regenerate one batch of fallback or stale bios.
+
+    names maps slug -> display name for the prompt, and model_of(name) gives
+    the model that wrote a bio. A retry that fails again only
+    counts the attempt. Returns (refreshed, failed).
+    """
+    due = store.needs_refresh(max_age_days)[:batch_size]
+    if not due:
+        return 0, 0
+    names = names or {}
+    by_name = {names.get(slug) or store.entries[slug]['name']: slug for slug in due}
+    print(f"Refreshing {len(due)} of {len(store.needs_refresh(max_age_days))} fallback or stale bios")
+
+    def on_result(name, text, ok):
+        slug = by_name[name]
+        if ok:
+            store.put(slug, name, text, model_of(name))
+        else:
+            store.record_failure(slug)
+
+    succeeded, failed = generate_bios(list(by_name), complete, on_result, workers=workers)
+    return succeeded, failed
+
+
+def cmd_stats(args):
+    store = BioStore(args.bios, args.log)
+    print(json.dumps(store.stats()))
+    due = store.needs_refresh(args.max_age_days)
+    print(f"{len(due)} due for refresh: {', '.join(due[:10])}{' ...' if len(due) > 10 else ''}")
+
+
+def cmd_refresh(args):
+    import generate_article
+    store = BioStore(args.bios, args.log)
+    refresh(store, generate_article.claude_bio, generate_article.bio_models.get,
+            args.batch, args.max_age_days)
+    store.save_snapshot()
+    store.compact()
+
+
+def cmd_compact(args):
+    store = BioStore(args.bios, args.log)
+    store.save_snapshot()
+    print(f"Dropped {store.compact(force=True)} superseded log lines")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bios', default='name-bios.json')
+    parser.add_argument('--log', default='name-bios.jsonl')
+    parser.add_argument('--max-age-days', type=int, default=180)
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('stats', help='count bios by status and list those due for refresh')
+    p.set_defaults(func=cmd_stats)
+    p = sub.add_parser('refresh', help='regenerate one batch of fallback or stale bios')
+    p.add_argument('--batch', type=int, default=5)
+    p.set_defaults(func=cmd_refresh)
+    p = sub.add_parser('compact', help='rewrite the log with one line per bio')
+    p.set_defaults(func=cmd_compact)
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Stage checkpoints so a rerun of the daily pipeline skips finished work.
+
+Each stage's output (fetched articles, roundup JSON, rendered HTML, ...) is
+saved under .cache/checkpoints/<date>/ with a hash of the stage's inputs.
+On the next run a stage is skipped when its inputs hash the same and the
+files it produced are still exactly as it left them. A crash in the feed
+or name-page stages therefore no longer repeats the RSS fetch and the
+Claude call.
+
+Stages that insert into shared files (index.html, feed.xml, sitemap.xml)
+save those files' previous contents. If such a stage has to run again
+with different inputs, the old insert is rolled back first, so the site
+never gets the same day twice. A fresh checkout, where the insert was
+never committed, simply runs the stage again.
+
+    python .github/scripts/checkpoints.py status [--date 2026-06-01]
+    python .github/scripts/checkpoints.py resume    # rerun today, skipping finished stages
+    python .github/scripts/checkpoints.py clear [--date 2026-06-01]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime, timedelta
+
+from fileutil import write_atomic
+
+DEFAULT_CHECKPOINT_DIR = '.cache/checkpoints'
+
+
+def input_hash(*inputs):
+    canonical = json.dumps(inputs, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def _file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class Checkpoints:
+    def __init__(self, root, date, enabled=True):
+        self.dir = os.path.join(root, date)
+        self.root = root
+        self.enabled = enabled
+        self.manifest_path = os.path.join(self.dir, 'manifest.json')
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {'stages': {}, 'complete': False}
+
+    @property
+    def started(self):
+        return bool(self.manifest['stages'])
+
+    @property
+    def complete(self):
+        return self.manifest['complete']
+
+    def _save_manifest(self):
+        os.makedirs(self.dir, exist_ok=True)
+        write_atomic(self.manifest_path, json.dumps(self.manifest, indent=1))
+
+    def _output_path(self, stage):
+        return os.path.join(self.dir, f"{stage}.json")
+
+    def _before_path(self, stage, path):
+        return os.path.join(self.dir, f"{stage}.before.{path.replace(os.sep, '_')}")
+
+    def run(self, stage, inputs, produce, products=(), restore=()):
+        """Return (output, resumed) for a stage, calling produce() only if needed.
+
+        products are files the stage writes; it reruns if any of them changed
+        since it finished. restore are products the stage edits in place;
+        their previous contents are put back before it runs again.
+        """
+        if not self.enabled:
+            return produce(), False
+        key = input_hash(*inputs)
+        entry = self.manifest['stages'].get(stage)
+        untouched = entry is not None and all(_file_hash(p) == h for p, h in entry['products'].items())
+        if untouched and entry['key'] == key:
+            try:
+                with open(self._output_path(stage), 'r', encoding='utf-8') as f:
+                    return json.load(f)['output'], True
+            except (OSError, ValueError, KeyError):
+                pass
+
+        if untouched:
+            # Ran before with other inputs and its edits are still in place: undo them
+            for path in entry.get('restore', []):
+                shutil.copyfile(self._before_path(stage, path), path)
+                print(f"  Rolled back {path} to before the earlier {stage} stage")
+        else:
+            os.makedirs(self.dir, exist_ok=True)
+            for path in restore:
+                if os.path.exists(path):
+                    shutil.copyfile(path, self._before_path(stage, path))
+
+        # Forget the stage until it finishes, so a crash midway can't look done
+        self.manifest['stages'].pop(stage, None)
+        self.manifest['complete'] = False
+        self._save_manifest()
+
+        output = produce()
+        write_atomic(self._output_path(stage), json.dumps({'output': output}, ensure_ascii=False))
+        self.manifest['stages'][stage] = {
+            'key': key,
+            'finished': int(time.time()),
+            'products': {p: _file_hash(p) for p in products},
+            'restore': [p for p in restore if os.path.exists(self._before_path(stage, p))],
+        }
+        self._save_manifest()
+        return output, False
+
+    def discard(self, stage):
+        """Forget a stage's result, e.g. an empty fetch that should be retried."""
+        if self.manifest['stages'].pop(stage, None) is not None:
+            self._save_manifest()
+
+    def finish(self):
+        if self.enabled:
+            self.manifest['complete'] = True
+            self._save_manifest()
+
+    def clear(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self.manifest = {'stages': {}, 'complete': False}
+
+    def prune(self, keep_days):
+        """Remove checkpoints for dates more than keep_days ago."""
+        if not os.path.isdir(self.root):
+            return
+        cutoff = (datetime.now() - timedelta(days=keep_days)).strftime('%Y-%m-%d')
+        for name in os.listdir(self.root):
+            if name < cutoff:
+                shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+
+def cmd_status(args):
+    checkpoints = Checkpoints(args.dir, args.date)
+    if not checkpoints.started:
+        print(f"No checkpoints for {args.date}")
+        return
+    print(f"{args.date}: {'complete' if checkpoints.complete else 'incomplete'}")
+    for stage, entry in checkpoints.manifest['stages'].items():
+        changed = [p for p, h in entry['products'].items() if _file_hash(p) != h]
+        finished = datetime.fromtimestamp(entry['finished']).strftime('%H:%M:%S')
+        note = f"  changed since: {', '.join(changed)}" if changed else ''
+        print(f"  {stage:<14} {entry['key']}  {finished}{note}")
+
+
+def cmd_resume(args):
+    import generate_article
+    generate_article.main(resume=True)
+
+
+def cmd_clear(args):
+    Checkpoints(args.dir, args.date).clear()
+    print(f"Cleared checkpoints for {args.date}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dir', default=os.environ.get('CHECKPOINT_DIR', DEFAULT_CHECKPOINT_DIR))
+    parser.add_argument('--date', default=datetime.now().strftime('%Y-%m-%d'))
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('status', help="list a day's finished stages")
+    p.set_defaults(func=cmd_status)
+    p = sub.add_parser('resume', help="rerun today's pipeline, skipping finished stages")
+    p.set_defaults(func=cmd_resume)
+    p = sub.add_parser('clear', help="delete a day's checkpoints")
+    p.set_defaults(func=cmd_clear)
+    args = parser.parse_args()
+    sys.exit(args.func(args) or 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+On-disk HTTP cache for the Google News RSS fetcher.
+
+Stores each feed body next to its ETag / Last-Modified validators so later
+runs (including same-day workflow_dispatch reruns) can send a conditional
+GET and reuse the stored body when the server answers 304 Not Modified.
+Each entry is a <key>.json of validators beside the <key>.xml body, kept
+within the TTL and size cap by fileutil.evict().
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from fileutil import evict, remove, write_atomic
+
+
+class FeedCache:
+    def __init__(self, cache_dir, ttl_seconds, max_bytes):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.hits = 0
+        self.bytes_saved = 0
+        self.seconds_saved = 0.0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.xml'
+
+    def _load_meta(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - meta.get('stored_at', 0) > self.ttl_seconds or not os.path.exists(body_path):
+            return None
+        return meta
+
+    def conditional_headers(self, url):
+        """Return If-None-Match / If-Modified-Since headers for a cached URL."""
+        meta = self._load_meta(url)
+        headers = {}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def tee(self, url, chunks, headers, started):
+        """Wrap a 200 response's chunks so they are written to the cache as they stream.
+
+        The body goes to a temp file. It only becomes the cached copy when
+        the caller calls commit() after parsing it; discard() drops it, so
+        a feed that fails to parse is never served again after a 304.
+        """
+        with self.lock:
+            self.requests += 1
+        return _Tee(self, url, chunks, headers.get('ETag'), headers.get('Last-Modified'), started)
+
+    def revalidated(self, url, elapsed):
+        """Return the stored body's chunks after a 304 and refresh the entry's age."""
+        meta_path, body_path = self._paths(url)
+        meta = self._load_meta(url)
+        if meta is None:
+            raise LookupError(f"304 for {url} but no cached body")
+        meta['stored_at'] = time.time()
+        write_atomic(meta_path, json.dumps(meta))
+        with self.lock:
+            self.requests += 1
+            self.hits += 1
+            self.bytes_saved += meta.get('size', 0)
+            self.seconds_saved += max(0.0, meta.get('fetch_seconds', 0.0) - elapsed)
+        return self._read_chunks(body_path)
+
+    @staticmethod
+    def _read_chunks(path, chunk_size=64 * 1024):
+        with open(path, 'rb') as f:
+            yield from iter(lambda: f.read(chunk_size), b'')
+
+    def evict(self):
+        """Drop expired entries, then the oldest ones until under max_bytes."""
+        evict(self.cache_dir, self.ttl_seconds, self.max_bytes, companions=('.xml',))
+
+    def report(self):
+        rate = (self.hits / self.requests * 100) if self.requests else 0.0
+        print(f"RSS cache: {self.hits}/{self.requests} revalidated ({rate:.0f}% hit rate), "
+              f"saved {self.bytes_saved / 1024:.1f} KB and ~{self.seconds_saved:.1f}s")
+
+
+class _Tee:
+    def __init__(self, cache, url, chunks, etag, last_modified, started):
+        self.cache = cache
+        self.url = url
+        self.chunks = chunks
+        self.etag = etag
+        self.last_modified = last_modified
+        self.started = started
+        self.size = 0
+        self.complete = False
+        self.meta_path, self.body_path = cache._paths(url)
+        self.tmp_path = f"{self.body_path}.{threading.get_ident()}.tmp"
+
+    def __iter__(self):
+        if not self.etag and not self.last_modified:
+            yield from self.chunks  # nothing to revalidate with, so nothing to store
+            return
+        with open(self.tmp_path, 'wb') as f:
+            for chunk in self.chunks:
+                f.write(chunk)
+                self.size += len(chunk)
+                yield chunk
+        self.complete = True
+
+    def commit(self):
+        """Make the fully read body the cached copy for its URL."""
+        if not self.complete:
+            return
+        os.replace(self.tmp_path, self.body_path)
+        write_atomic(self.meta_path, json.dumps({
+            'url': self.url,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'stored_at': time.time(),
+            'size': self.size,
+            'fetch_seconds': time.monotonic() - self.started,
+        }))
+
+    def discard(self):
+        """Drop the temp body (a no-op once committed)."""
+        remove(self.tmp_path)
@@ -0,0 +1,74 @@
+"""
+File helpers shared by the pipeline's on-disk stores.
+
+write_atomic() writes through a temp file and a rename, so a crash never
+leaves a half-written page, snapshot or cache entry behind. evict() keeps
+a cache directory of <key>.json entries within its TTL and size cap.
+"""
+
+import json
+import os
+import threading
+import time
+
+STALE_TMP_SECONDS = 3600  # temp files older than this were left by a crash
+
+
+def write_atomic(path, text):
+    """Replace path with text in one rename."""
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    finally:
+        remove(tmp_path)
+
+
+def remove(*paths):
+    """Delete paths, ignoring any that are already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def evict(cache_dir, ttl_seconds, max_bytes, companions=()):
+    """Drop expired entries from cache_dir, then the oldest ones until under max_bytes.
+
+    An entry is a <key>.json file with a 'stored_at' time, plus one
+    <key><suffix> file per suffix in companions; an entry missing one of
+    them is dropped too. Returns the number of entries removed.
+    """
+    entries = []
+    removed = 0
+    now = time.time()
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.endswith('.tmp'):
+            if now - os.path.getmtime(path) > STALE_TMP_SECONDS:
+                remove(path)
+            continue
+        if not name.endswith('.json'):
+            continue
+        files = [path] + [path[:-len('.json')] + suffix for suffix in companions]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored_at = json.load(f).get('stored_at', 0)
+        except (OSError, ValueError):
+            stored_at = 0
+        if now - stored_at > ttl_seconds or not all(os.path.exists(p) for p in files):
+            remove(*files)
+            removed += 1
+            continue
+        entries.append((stored_at, sum(os.path.getsize(p) for p in files), files))
+
+    total = sum(e[1] for e in entries)
+    for stored_at, size, files in sorted(entries):
+        if total <= max_bytes:
+            break
+        remove(*files)
+        removed += 1
+        total -= size
+    return removed
@@ -12,16 +12,72 @@ DO NOT change this to ask Claude to "search for news" - it will fail.
 import os
 import json
 import re
-import random
+import threading
+import time
 import urllib.parse
-import urllib.request
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
-from anthropic import Anthropic
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
-
-client = Anthropic()
+from bio_generator import BIO_MAX_TOKENS, bio_problem, bio_prompt, generate_bios
+from bio_store import BioStore, refresh as refresh_bios
+from checkpoints import DEFAULT_CHECKPOINT_DIR, Checkpoints
+from feed_cache import FeedCache
+from fileutil import write_atomic
+from headline_clusters import cluster_headlines
+from http_pool import HTTPPool
+from link_resolver import LinkResolver
+from llm_backend import DEFAULT_FIXTURES_DIR, make_backend
+from llm_ledger import DEFAULT_LLM_LEDGER, LLMLedger
+from model_router import ModelRouter, parse_routes
+from name_tagger import load_tagger, slugify
+from news_store import NewsStore
+from paper_texture import paper_texture
+from perf_ledger import DEFAULT_LEDGER, append_run, archive_size
+from prompt_budget import PromptBuilder
+from query_planner import plan_queries, unique_yield
+from relevance import RelevanceScorer
+from response_cache import ResponseCache
+from roundup_index import RoundupIndex
+from roundup_validator import (MAX_BULLETS, ArticleIndex, drop_bullets, move_lead_bullet,
+                               validate_roundup, yesterday_lead)
+from run_report import RunReport
+from stream_json import IncrementalJSONParser
+
+# anthropic (default), record, replay or fake; see llm_backend.py
+LLM_BACKEND = os.environ.get('LLM_BACKEND', 'anthropic')
+_llm = None
+
+def llm():
+    """Return the configured LLM backend, constructing it on first use."""
+    global _llm
+    if _llm is None:
+        _llm = make_backend(LLM_BACKEND,
+                            fixtures_dir=os.environ.get('LLM_FIXTURES_DIR', DEFAULT_FIXTURES_DIR),
+                            fake_latency=float(os.environ.get('LLM_FAKE_LATENCY', '0')))
+    return _llm
+
+# Token usage across this run's LLM calls, including prompt-cache reads and writes
+llm_usage = {}
+_llm_usage_lock = threading.Lock()
+
+def record_usage(completion):
+    with _llm_usage_lock:
+        for key, value in completion.usage.items():
+            llm_usage[key] = llm_usage.get(key, 0) + value
+    return completion
+
+# Every model call's tokens and latency, appended to the ledger unless LLM_LEDGER=0
+LLM_LEDGER = os.environ.get('LLM_LEDGER', '1') != '0'
+llm_ledger = LLMLedger(DEFAULT_LLM_LEDGER if LLM_LEDGER else None)
+
+# Model tier for each kind of call, with fallback to a stronger tier; see model_router.py
+router = ModelRouter(parse_routes(os.environ.get('LLM_ROUTES')))
+
+def call_llm(purpose, request, on_text=None, attempt=1):
+    """Call the model (streaming if on_text is given) and record usage and latency."""
+    return record_usage(llm_ledger.call(purpose, llm(), request, on_text, attempt))
 
 def read_file(path):
     with open(path, 'r', encoding='utf-8') as f:
@@ -29,8 +85,7 @@ def read_file(path):
 
 def write_file(path, content):
     os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_atomic(path, content)
 
 def get_existing_roundups():
     roundups = []
@@ -39,95 +94,380 @@ def get_existing_roundups():
             roundups.append(f)
     return roundups
 
-def fetch_news_from_rss():
-    """Fetch news from Google News RSS - Claude API cannot search the web."""
-    queries = [
-        # Specific individuals - spread across many names for diversity
-        "epstein+prince+andrew",
-        "epstein+bill+gates",
-        "epstein+ghislaine+maxwell",
-        "epstein+les+wexner",
-        "epstein+jean-luc+brunel",
-        "epstein+elon+musk",
-        "epstein+bill+clinton",
-        "epstein+donald+trump",
-        "epstein+peter+thiel+reid+hoffman",
-        # Victims, legal, accountability
-        "epstein+victim+survivor+lawsuit",
-        "epstein+trafficking+charges+arrest",
-        "epstein+settlement+lawsuit+court",
-        # Documents and investigations
-        "epstein+flight+logs+names",
-        "epstein+documents+unsealed+names",
-        "epstein+island+little+st+james",
-        "jeffrey+epstein+investigation+new",
-        "epstein+connections+revealed+billionaire",
-        # International angles
-        "epstein+europe+investigation",
-        "epstein+intelligence+FBI+CIA",
-        "epstein+UK+Israel+international",
-    ]
+# Google News queries - spread across many names for diversity
+RSS_QUERIES = [
+    # Specific individuals - spread across many names for diversity
+    "epstein+prince+andrew",
+    "epstein+bill+gates",
+    "epstein+ghislaine+maxwell",
+    "epstein+les+wexner",
+    "epstein+jean-luc+brunel",
+    "epstein+elon+musk",
+    "epstein+bill+clinton",
+    "epstein+donald+trump",
+    "epstein+peter+thiel+reid+hoffman",
+    # Victims, legal, accountability
+    "epstein+victim+survivor+lawsuit",
+    "epstein+trafficking+charges+arrest",
+    "epstein+settlement+lawsuit+court",
+    # Documents and investigations
+    "epstein+flight+logs+names",
+    "epstein+documents+unsealed+names",
+    "epstein+island+little+st+james",
+    "jeffrey+epstein+investigation+new",
+    "epstein+connections+revealed+billionaire",
+    # International angles
+    "epstein+europe+investigation",
+    "epstein+intelligence+FBI+CIA",
+    "epstein+UK+Israel+international",
+]
+
+RSS_BASE_URL = os.environ.get('RSS_BASE_URL', 'https://news.google.com').rstrip('/')
+RSS_USER_AGENT = 'Mozilla/5.0 (compatible; EpsteinFilesDaily/1.0)'
+RSS_MAX_WORKERS = int(os.environ.get('RSS_MAX_WORKERS', '8'))
+RSS_PER_HOST_LIMIT = int(os.environ.get('RSS_PER_HOST_LIMIT', '4'))
+RSS_QUERY_TIMEOUT = 30
+RSS_FETCH_DEADLINE = float(os.environ.get('RSS_FETCH_DEADLINE', '60'))
+RSS_CHUNK_SIZE = 64 * 1024
+RSS_MAX_AGE_HOURS = 48  # only articles from the last 48 hours
+RSS_MAX_ARTICLES = 20  # stories passed to Claude
+RSS_QUERY_BUDGET = int(os.environ.get('RSS_QUERY_BUDGET', '15'))  # 0 runs every query
+
+RUN_REPORT_PATH = 'run_report.json'  # per-stage timings, written next to latest_article.json
+PERF_LEDGER = os.environ.get('PERF_LEDGER', '1') != '0'  # append each run to the ledger
+
+# Stage checkpoints, so a rerun after a crash skips the stages that finished
+CHECKPOINTS = os.environ.get('CHECKPOINTS', '1') != '0'
+CHECKPOINT_DIR = os.environ.get('CHECKPOINT_DIR', DEFAULT_CHECKPOINT_DIR)
+CHECKPOINT_KEEP_DAYS = int(os.environ.get('CHECKPOINT_KEEP_DAYS', '7'))
+
+# Keep-alive connections with gzip/deflate, shared by the fetcher and link resolver
+http_pool = HTTPPool(max_idle_per_host=RSS_PER_HOST_LIMIT)
+
+# The stores below touch the disk, so each is built on first use, like llm()
+_stores = {}
+_stores_lock = threading.Lock()
+
+def _store(name, build):
+    with _stores_lock:
+        if name not in _stores:
+            _stores[name] = build()
+        return _stores[name]
+
+# Conditional-GET cache for feed bodies (set RSS_CACHE=0 to disable)
+RSS_CACHE = os.environ.get('RSS_CACHE', '1') != '0'
+RSS_CACHE_DIR = os.environ.get('RSS_CACHE_DIR', '.cache/rss')
+RSS_CACHE_TTL_HOURS = float(os.environ.get('RSS_CACHE_TTL_HOURS', '72'))
+RSS_CACHE_MAX_MB = float(os.environ.get('RSS_CACHE_MAX_MB', '50'))
+
+def feed_cache():
+    """Return the feed cache, or None if it is disabled."""
+    if not RSS_CACHE:
+        return None
+    return _store('feed_cache', lambda: FeedCache(RSS_CACHE_DIR, RSS_CACHE_TTL_HOURS * 3600,
+                                                  int(RSS_CACHE_MAX_MB * 1024 * 1024)))
 
-    all_articles = []
-    seen_titles = set()
+# Every ingested item is kept so runs only pass along what is new (set NEWS_STORE=0 to disable)
+NEWS_STORE = os.environ.get('NEWS_STORE', '1') != '0'
+NEWS_STORE_PATH = os.environ.get('NEWS_STORE_PATH', '.cache/news.db')
+NEWS_MIN_NEW_ARTICLES = 4  # below this, fall back to previously seen articles
+
+def news_store():
+    """Return the item store, or None if it is disabled."""
+    if not NEWS_STORE:
+        return None
+    return _store('news_store', lambda: NewsStore(NEWS_STORE_PATH))
 
-    for query in queries:
-        url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
-        try:
-            print(f"Fetching: {url}")
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0 (compatible; EpsteinFilesDaily/1.0)'})
-            with urllib.request.urlopen(req, timeout=30) as response:
-                xml_data = response.read().decode('utf-8')
-
-            root = ET.fromstring(xml_data)
-            for item in root.findall('.//item'):
-                title = item.find('title')
-                link = item.find('link')
-                source = item.find('source')
-                pub_date = item.find('pubDate')
-
-                if title is not None and link is not None:
-                    title_text = title.text or ""
-                    if title_text.lower() not in seen_titles:
-                        seen_titles.add(title_text.lower())
-                        all_articles.append({
-                            'title': title_text,
-                            'url': link.text or "",
-                            'source': source.text if source is not None else "News",
-                            'date': pub_date.text if pub_date is not None else ""
-                        })
-        except Exception as e:
-            print(f"Error fetching {query}: {e}")
-
-    # Filter by date - only articles from the last 48 hours
-    cutoff = datetime.now().astimezone() - timedelta(hours=48)
-    recent = []
-    undated = []
-    for a in all_articles:
-        if a['date']:
+# Google News links are redirects; swap them for publisher URLs (set LINK_RESOLVER=0 to disable)
+LINK_RESOLVER = os.environ.get('LINK_RESOLVER', '1') != '0'
+LINK_CACHE_PATH = os.environ.get('LINK_CACHE_PATH', '.cache/links')
+
+def link_resolver():
+    """Return the redirect resolver, or None if it is disabled."""
+    if not LINK_RESOLVER:
+        return None
+    return _store('link_resolver', lambda: LinkResolver(
+        LINK_CACHE_PATH,
+        redirect_hosts={'news.google.com', urllib.parse.urlsplit(RSS_BASE_URL).netloc.lower()},
+        user_agent=RSS_USER_AGENT,
+        pool=http_pool))
+
+# Claude responses keyed by the exact request, so same-input reruns skip the API
+# (LLM_CACHE=0 disables it, LLM_CACHE=refresh ignores stored responses but saves new ones)
+LLM_CACHE = os.environ.get('LLM_CACHE', '1')
+LLM_CACHE_DIR = os.environ.get('LLM_CACHE_DIR', '.cache/llm')
+LLM_CACHE_TTL_HOURS = float(os.environ.get('LLM_CACHE_TTL_HOURS', '168'))
+LLM_CACHE_MAX_MB = float(os.environ.get('LLM_CACHE_MAX_MB', '20'))
+
+def response_cache():
+    """Return the Claude response cache, or None if it is disabled."""
+    if LLM_CACHE == '0':
+        return None
+    return _store('response_cache', lambda: ResponseCache(
+        LLM_CACHE_DIR, LLM_CACHE_TTL_HOURS * 3600, int(LLM_CACHE_MAX_MB * 1024 * 1024),
+        read=LLM_CACHE != 'refresh'))
+
+# Past roundups are summarized from a compact index instead of listing every page
+ROUNDUP_INDEX_PATH = 'roundup-index.json'
+ROUNDUP_HISTORY_LIMIT = 14  # recent headlines shown to Claude
+ROUNDUP_LEAD_WINDOW = 30  # roundups counted for the frequent-leads line
+PROMPT_TOKEN_BUDGET = int(os.environ.get('PROMPT_TOKEN_BUDGET', '8000'))  # 0 disables trimming
+PROMPT_MIN_ARTICLES = 8  # never trim the article list below this
+BIO_WORKERS = int(os.environ.get('BIO_WORKERS', '4'))  # concurrent bio requests
+BIO_REFRESH_BATCH = int(os.environ.get('BIO_REFRESH_BATCH', '5'))  # fallback/stale bios retried per run; 0 disables
+BIO_MAX_AGE_DAYS = int(os.environ.get('BIO_MAX_AGE_DAYS', '180'))
+
+def roundup_index():
+    """Return the index of past roundups, loading (or rebuilding) it on first use."""
+    return _store('roundup_index', lambda: RoundupIndex(ROUNDUP_INDEX_PATH))
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+def _host_semaphore(host):
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(RSS_PER_HOST_LIMIT)
+        return _host_semaphores[host]
+
+def _fetch_feed(url, deadline, cutoff):
+    """Download and parse one feed, respecting the per-host cap and the global deadline.
+
+    Runs on a worker thread, so instead of printing it returns
+    (articles, log lines) for the caller to print.
+    """
+    log = []
+    sem = _host_semaphore(urllib.parse.urlsplit(url).netloc)
+    remaining = deadline - time.monotonic()
+    if remaining <= 0 or not sem.acquire(timeout=remaining):
+        raise TimeoutError("fetch deadline reached before request started")
+    try:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("fetch deadline reached before request started")
+        log.append(f"Fetching: {url}")
+        headers = {'User-Agent': RSS_USER_AGENT}
+        cache = feed_cache()
+        if cache:
+            headers.update(cache.conditional_headers(url))
+        started = time.monotonic()
+        with http_pool.request(url, headers, timeout=min(RSS_QUERY_TIMEOUT, remaining)) as response:
+            if response.status == 304 and cache:
+                chunks = cache.revalidated(url, time.monotonic() - started)
+                return parse_feed_stream(chunks, cutoff, log.append), log
+            chunks = response.iter_content(RSS_CHUNK_SIZE)
+            if not cache:
+                return parse_feed_stream(chunks, cutoff, log.append), log
+            # Cached only once the whole feed parsed, including the final close()
+            tee = cache.tee(url, chunks, response.headers, started)
             try:
-                pub_dt = parsedate_to_datetime(a['date'])
-                if pub_dt >= cutoff:
-                    recent.append(a)
-                else:
-                    print(f"  Skipping old article ({a['date']}): {a['title'][:60]}")
-            except Exception:
-                undated.append(a)  # Keep articles with unparseable dates
-        else:
-            undated.append(a)
+                articles = parse_feed_stream(tee, cutoff, log.append)
+                tee.commit()
+                return articles, log
+            finally:
+                tee.discard()
+    finally:
+        sem.release()
+
+def parse_feed_stream(chunks, cutoff, log=print):
+    """Incrementally parse RSS bytes into article dicts, dropping items older than cutoff.
+
+    Each <item> is turned into a small dict as soon as it closes and then
+    cleared from the tree, so memory stays flat however large the feed is.
+    Google News orders results by relevance rather than date, so old items
+    are skipped individually instead of ending the parse.
+
+    Articles with a missing or unparseable pubDate are kept with
+    'published' set to None; dated ones carry a POSIX timestamp.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    articles = []
+    skipped = 0
+    channel = None
+
+    def drain():
+        nonlocal channel, skipped
+        for event, elem in parser.read_events():
+            if event == 'start':
+                if elem.tag == 'channel':
+                    channel = elem
+                continue
+            if elem.tag != 'item':
+                continue
+
+            title = elem.findtext('title')
+            link = elem.findtext('link')
+            if title is not None and link is not None:
+                source = elem.findtext('source')
+                date_text = elem.findtext('pubDate') or ""
+                published = None
+                if date_text:
+                    try:
+                        pub_dt = parsedate_to_datetime(date_text)
+                        if pub_dt < cutoff:
+                            skipped += 1
+                            date_text = None
+                        else:
+                            published = pub_dt.timestamp()
+                    except Exception:
+                        pass  # Keep articles with unparseable dates
+                if date_text is not None:
+                    articles.append({
+                        'title': title,
+                        'url': link,
+                        'source': source if source is not None else "News",
+                        'date': date_text,
+                        'published': published,
+                    })
+
+            # Free the processed item (and anything before it in <channel>)
+            elem.clear()
+            if channel is not None:
+                del channel[:]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        drain()
+    parser.close()
+    drain()
+
+    if skipped:
+        log(f"  Skipped {skipped} articles older than {cutoff:%Y-%m-%d %H:%M}")
+    return articles
+
+def fetch_all_feeds(queries):
+    """Fetch every query concurrently and return per-query article lists.
+
+    Results come back in the same order as ``queries`` no matter which
+    request finishes first; queries that fail or miss the deadline yield None.
+    """
+    deadline = time.monotonic() + RSS_FETCH_DEADLINE
+    cutoff = datetime.now().astimezone() - timedelta(hours=RSS_MAX_AGE_HOURS)
+    results = [None for _ in queries]
+    started = time.monotonic()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, RSS_MAX_WORKERS))
+    futures = {}
+    for i, query in enumerate(queries):
+        url = f"{RSS_BASE_URL}/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+        futures[executor.submit(_fetch_feed, url, deadline, cutoff)] = i
+
+    # Workers hand back their log lines, printed here as each feed finishes so feeds don't interleave
+    done = set()
+    try:
+        for future in as_completed(futures, timeout=max(0, deadline - time.monotonic())):
+            done.add(future)
+            i = futures[future]
+            try:
+                results[i], log = future.result()
+            except Exception as e:
+                print(f"Error fetching {queries[i]}: {e}")
+                continue
+            for line in log:
+                print(line)
+    except FuturesTimeoutError:
+        pass
+    for future, i in futures.items():
+        if future not in done:
+            print(f"Error fetching {queries[i]}: deadline of {RSS_FETCH_DEADLINE:.0f}s exceeded")
+    executor.shutdown(wait=False, cancel_futures=True)
 
-    print(f"Found {len(recent)} articles from last 48 hours, {len(undated)} undated")
+    http_pool.report('RSS fetch')
+    cache = feed_cache()
+    if cache:
+        cache.report()
+        cache.evict()
+
+    print(f"Fetched {len(done)}/{len(queries)} feeds in {time.monotonic() - started:.1f}s")
+    return results
+
+def fetch_news_from_rss():
+    """Fetch news from Google News RSS - Claude API cannot search the web."""
+    all_articles = []
+    seen_titles = set()
+    scorer = get_relevance_scorer()
+
+    queries = RSS_QUERIES
+    store = news_store()
+    if store:
+        queries = plan_queries(RSS_QUERIES, store.query_history(), RSS_QUERY_BUDGET)
+    per_query = fetch_all_feeds(queries)
+
+    # Merge in query order so de-duplication is independent of fetch timing
+    for articles in per_query:
+        for a in articles or []:
+            if a['title'].lower() not in seen_titles:
+                seen_titles.add(a['title'].lower())
+                all_articles.append(a)
+
+    new_titles = None
+    if store:
+        store.record_query_stats(unique_yield(queries, per_query, scorer.score))
+        new_articles = store.ingest(all_articles)
+        print(f"{len(new_articles)} of {len(all_articles)} articles are new since the last successful run")
+        new_titles = {a['title'].lower() for a in new_articles}
+
+    # Items older than RSS_MAX_AGE_HOURS were already dropped while parsing
+    recent = [a for a in all_articles if a['published'] is not None]
+    undated = [a for a in all_articles if a['published'] is None]
+
+    print(f"Found {len(recent)} articles from last {RSS_MAX_AGE_HOURS} hours, {len(undated)} undated")
 
     # Use recent articles first, fall back to undated if needed
     filtered = recent + undated
 
-    # Filter for relevance - broad keywords to capture diverse stories
-    keywords = ['epstein', 'ghislaine', 'maxwell', 'prince andrew', 'wexner', 'brunel',
-                'trafficking', 'victim', 'survivor', 'unsealed', 'flight log',
-                'little st james', 'pedophile island']
-    relevant = [a for a in filtered if any(kw in a['title'].lower() for kw in keywords)]
+    # Filter for relevance - broad keywords plus every name we already track
+    relevant = scorer.filter(filtered)
     print(f"Found {len(relevant)} relevant recent articles from RSS")
-    return relevant[:20]
+
+    # Prefer stories not offered before, but only if enough of them are relevant
+    if new_titles is not None:
+        new_relevant = [a for a in relevant if a['title'].lower() in new_titles]
+        print(f"{len(new_relevant)} of the relevant articles are new since the last successful run")
+        if len(new_relevant) >= NEWS_MIN_NEW_ARTICLES:
+            relevant = new_relevant
+        else:
+            print("Too few new relevant articles, keeping previously seen ones as well")
+
+    # Collapse syndicated copies of the same story into one line for the prompt
+    stories = cluster_headlines(relevant)
+    before = sum(estimate_tokens(format_article_line(a)) for a in relevant)
+    after = sum(estimate_tokens(format_article_line(s)) for s in stories)
+    print(f"Clustered {len(relevant)} headlines into {len(stories)} stories, saving ~{before - after} prompt tokens")
+
+    # Keep the highest-scoring stories rather than the first ones fetched
+    selected = scorer.top_k(stories, RSS_MAX_ARTICLES)
+
+    resolver = link_resolver()
+    if resolver:
+        publisher_urls = resolver.resolve_all([a['url'] for a in selected])
+        for a in selected:
+            a['url'] = publisher_urls.get(a['url'], a['url'])
+    return selected
+
+def get_relevance_scorer():
+    try:
+        known_names = list(json.loads(read_file('name-bios.json')))
+    except Exception:
+        known_names = []
+    return RelevanceScorer(names=known_names)
+
+def get_name_tagger():
+    """Tagger for every person with a bio, spelled as the published tags spell them."""
+    return load_tagger('name-bios.json', display_names=[n for e in roundup_index().entries for n in e['names']])
+
+def estimate_tokens(text):
+    """Rough token count (about 4 characters per token for English)."""
+    return (len(text) + 3) // 4
+
+def format_article_line(a):
+    """Format one fetched article as a line of the roundup prompt."""
+    line = f"- {a['title']} (Source: {a['source']}, Published: {a['date'] or 'Unknown'}, URL: {a['url']})"
+    if a.get('alternates'):
+        line += f" [Also reported by: {', '.join(alt['source'] for alt in a['alternates'])}]"
+    if a.get('people'):
+        line += f" [People: {', '.join(a['people'])}]"
+    return line
 
 def generate_thumbnail(date_str, headline, filename, featured_name=""):
     """Generate newspaper-style thumbnail with paper texture."""
@@ -135,31 +475,8 @@ def generate_thumbnail(date_str, headline, filename, featured_name=""):
     WIDTH = 840
     HEIGHT = 472
 
-    img = Image.new('RGB', (WIDTH, HEIGHT), '#f4ead5')
-    draw = ImageDraw.Draw(img)
-    pixels = img.load()
-
-    # Add paper texture - noise
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            r, g, b = pixels[x, y]
-            noise = random.randint(-8, 8)
-            edge_dist = min(x, WIDTH-x, y, HEIGHT-y)
-            edge_darken = max(0, 15 - edge_dist // 8)
-            r = max(0, min(255, r + noise - edge_darken))
-            g = max(0, min(255, g + noise - edge_darken - 3))
-            b = max(0, min(255, b + noise - edge_darken - 8))
-            pixels[x, y] = (r, g, b)
-
-    # Add vignette
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            r, g, b = pixels[x, y]
-            cx, cy = WIDTH // 2, HEIGHT // 2
-            dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-            max_dist = ((cx) ** 2 + (cy) ** 2) ** 0.5
-            vignette = 1 - (dist / max_dist) * 0.15
-            pixels[x, y] = (int(r * vignette), int(g * vignette), int(b * vignette))
+    # Paper texture: noise, darkened edges and a vignette
+    img = paper_texture(Image.new('RGB', (WIDTH, HEIGHT), '#f4ead5'))
 
     draw = ImageDraw.Draw(img)
     ink = '#1a1816'
@@ -244,50 +561,9 @@ def generate_thumbnail(date_str, headline, filename, featured_name=""):
     img.save(filename, 'PNG')
     print(f"Created thumbnail: {filename}")
 
-def generate_roundup(articles):
-    """Use Claude to format the fetched articles into a roundup."""
-
-    if not articles:
-        print("No articles to format")
-        return None
-
-    existing = get_existing_roundups()
-    today = datetime.now()
-
-    # Format articles for Claude — include publish date so it can verify recency
-    articles_text = "\n".join([
-        f"- {a['title']} (Source: {a['source']}, Published: {a['date'] or 'Unknown'}, URL: {a['url']})"
-        for a in articles
-    ])
-
-    # Load yesterday's article to inform diversity rules
-    yesterday_names = []
-    yesterday_headline = ""
-    try:
-        with open('latest_article.json', 'r') as f:
-            yesterday = json.loads(f.read())
-            yesterday_names = yesterday.get('names', [])
-            yesterday_headline = yesterday.get('theme_headline', yesterday.get('headline', ''))
-    except Exception:
-        pass
-
-    yesterday_context = ""
-    if yesterday_names or yesterday_headline:
-        yesterday_context = f"""
-YESTERDAY'S ARTICLE (DO NOT REPEAT):
-- Headline: {yesterday_headline}
-- Featured names: {', '.join(yesterday_names)}
-- You MUST choose a DIFFERENT lead name/angle today. If yesterday led with Prince Andrew, today should lead with someone else.
-"""
-
-    prompt = f"""You are formatting a news roundup for Epstein Files Daily.
-
-TODAY'S DATE: {today.strftime('%A, %B %d, %Y')}
-
-EXISTING ROUNDUPS (avoid repeating old headlines): {existing}
-{yesterday_context}
-HERE ARE THE NEWS ARTICLES FETCHED FROM RSS (these are REAL articles with REAL URLs):
-{articles_text}
+# Static rules, identical every day. Sent as the system prompt ahead of the
+# day's data and marked for prompt caching, so keep anything dynamic out of it.
+ROUNDUP_INSTRUCTIONS = """You are formatting a news roundup for Epstein Files Daily. Each request gives today's date, recent roundups, yesterday's article and the news articles fetched from RSS.
 
 YOUR TASK:
 1. Select 4-6 of the most newsworthy and distinct stories
@@ -310,7 +586,7 @@ CRITICAL DIVERSITY RULES:
 - Look for stories about: financial connections, enablers, lawyers, corporate resignations, victim advocacy, international investigations, new names surfacing, institutional accountability — not just the biggest headline.
 
 CRITICAL DATE RULE:
-- Today's date is {today.strftime('%B %d, %Y')}
+- Today's date is given at the top of the request
 - ONLY use articles published TODAY or YESTERDAY. Check the "Published:" date on each article.
 - If an article's publish date is more than 2 days old, DO NOT include it.
 - If you cannot verify the date, skip the article.
@@ -323,83 +599,285 @@ AVOID:
 - Do NOT include articles older than 2 days — this is a daily news roundup, not a recap
 
 OUTPUT FORMAT - Return a JSON object:
-{{
+{
     "theme_headline": "Short punchy headline that MUST include at least one specific person's name AND must be a DIFFERENT person than yesterday's headline. (e.g., 'Les Wexner Faces New Lawsuit', 'Victims Push for Accountability Against Maxwell Associates', 'Ghislaine Maxwell Appeal Rejected'). NEVER use generic headlines like 'DOJ Releases Files'. Always lead with the most newsworthy INDIVIDUAL who was NOT yesterday's lead.",
     "featured_name": "The most prominent person's name from the headline — MUST be different from yesterday's featured name",
     "names": ["Full Name 1", "Full Name 2", "Full Name 3"],
     "bullets_short": [
-        {{"name": "Key Subject", "text": "one-line summary.", "source": "Source Name", "url": "actual URL from article"}},
+        {"name": "Key Subject", "text": "one-line summary.", "source": "Source Name", "url": "actual URL from article"},
         ...
     ],
     "bullets_long": [
-        {{"name": "Key Subject", "text": "2-4 sentence detailed summary with context.", "source": "Source Name", "url": "actual URL from article"}},
+        {"name": "Key Subject", "text": "2-4 sentence detailed summary with context.", "source": "Source Name", "url": "actual URL from article"},
         ...
     ]
-}}
+}
 
 RULES:
 1. bullets_short: ONE LINE each (for homepage card)
 2. bullets_long: 2-4 SENTENCES each (for article page)
 3. 4-6 bullets total with AT LEAST 3 different named individuals
 4. Lead each bullet with a bolded name or subject
-5. Use the ACTUAL URLs from the articles above - do not make up URLs
-6. Names array should only contain full person names (for tags)
-7. If fewer than 4 distinct newsworthy stories, return {{"no_news": true}}
+5. Use the ACTUAL URLs from the fetched articles - do not make up URLs
+6. Names array should only contain full person names (for tags). Articles marked [People: ...] have already been matched against people we cover; use exactly those spellings for them, and only identify people who are not listed there yourself
+7. If fewer than 4 distinct newsworthy stories, return {"no_news": true}
 8. AT MOST ONE bullet about DOJ/Bondi/government process per roundup — focus on the PEOPLE in the files
 9. The headline and first bullet MUST feature a DIFFERENT person than yesterday
 """
 
-    print("Calling Claude API to format roundup...")
+ROUNDUP_REQUIRED_FIELDS = ('theme_headline', 'names', 'bullets_short', 'bullets_long')
+BULLET_FIELDS = ('name', 'text', 'source', 'url')
+
+def bullet_problem(bullet):
+    """Return why a bullet can't be published, or None if it is fine."""
+    if not isinstance(bullet, dict):
+        return "not a JSON object"
+    missing = [f for f in BULLET_FIELDS if not isinstance(bullet.get(f), str) or not bullet[f].strip()]
+    if missing:
+        return f"missing {', '.join(missing)}"
+    if not bullet['url'].startswith(('http://', 'https://')):
+        return "url is not a link"
+    return None
+
+def roundup_problems(data):
+    """List the (path, reason) parts of a roundup that are missing or broken."""
+    if data.get('no_news'):
+        return []
+    problems = [(field, 'missing') for field in ROUNDUP_REQUIRED_FIELDS if not data.get(field)]
+    short = data.get('bullets_short') if isinstance(data.get('bullets_short'), list) else []
+    full = data.get('bullets_long') if isinstance(data.get('bullets_long'), list) else []
+    for key, bullets in (('bullets_short', short), ('bullets_long', full)):
+        for i, bullet in enumerate(bullets):
+            reason = bullet_problem(bullet)
+            if reason:
+                problems.append((f"{key}[{i}]", reason))
+    # Every story needs both a short and a long bullet
+    if short and full:
+        for i in range(len(short), len(full)):
+            problems.append((f"bullets_short[{i}]", f"missing (one-line version of bullets_long[{i}])"))
+        for i in range(len(full), len(short)):
+            problems.append((f"bullets_long[{i}]", f"missing (long version of bullets_short[{i}])"))
+    return problems
+
+def stream_claude(request, parser, purpose='roundup', attempt=1):
+    """Stream a Claude response into an IncrementalJSONParser; returns the Completion."""
+    return call_llm(purpose, request, parser.feed, attempt)
+
+def request_roundup_fixes(request, data, problems):
+    """Ask Claude for only the missing or broken parts of a roundup and merge them in."""
+    listing = "\n".join(f"- {path}: {reason}" for path, reason in problems)
+    fix_request = {**request, 'messages': request['messages'] + [
+        {"role": "assistant", "content": json.dumps(data, indent=2)},
+        {"role": "user", "content": f"""Some parts of that JSON are missing or invalid:
+{listing}
+
+Return ONLY a JSON object with corrected values for just these parts, using the same top-level keys.
+For a single bullet, map its index to the corrected bullet, e.g. {{"bullets_long": {{"2": {{"name": "...", "text": "...", "source": "...", "url": "..."}}}}}}
+Use the ACTUAL URLs from the articles above."""}]}
+
+    def request_fixes(model):
+        parser = IncrementalJSONParser()
+        stream_claude({**fix_request, 'model': model}, parser, purpose='repair')
+        fixes = parser.result()
+        if not isinstance(fixes, dict):
+            return None
+        if not fixes:
+            # Nothing to merge is a failed repair, not a successful one
+            print(f"  Repair from {model} came back empty")
+            return None
+        for key in ('bullets_short', 'bullets_long'):
+            if isinstance(fixes.get(key), dict) and any(bullet_problem(b) for b in fixes[key].values()):
+                return None
+        return fixes
+
+    fixes = router.run('repair', request_fixes)
+    if not fixes:
+        print("Repair failed: no usable fixes came back, leaving the roundup unchanged")
+        return data
+
+    for key, value in fixes.items():
+        if key in ('bullets_short', 'bullets_long') and isinstance(value, dict):
+            bullets = data[key] if isinstance(data.get(key), list) else []
+            for index, bullet in sorted((int(k), v) for k, v in value.items() if str(k).isdigit()):
+                if index < len(bullets):
+                    bullets[index] = bullet
+                else:
+                    bullets.append(bullet)
+            data[key] = bullets
+        else:
+            data[key] = value
+    print(f"Merged fixes for {', '.join(fixes)}")
+    return data
 
-    max_retries = 3
-    for attempt in range(1, max_retries + 1):
-        print(f"API attempt {attempt}/{max_retries}...")
+def enforce_roundup_rules(request, data, articles, yesterday):
+    """Check a roundup locally and regenerate only the parts that break the rules.
 
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4000,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    Returns (data, changed).
+    """
+    index = ArticleIndex(articles)
+    cutoff = time.time() - RSS_MAX_AGE_HOURS * 3600
+    lead = yesterday_lead(yesterday)
+    changed = False
+    for key in ('bullets_short', 'bullets_long'):
+        if len(data[key]) > MAX_BULLETS:
+            data[key] = data[key][:MAX_BULLETS]
+            changed = True
+    if move_lead_bullet(data, lead):
+        print(f"Moved the story about {lead} out of the lead slot")
+        changed = True
+
+    problems = validate_roundup(data, index, cutoff, lead)
+    if not problems:
+        print("Roundup passed local validation")
+        return data, changed
+
+    print(f"Local validation found {len(problems)} problems, regenerating only those parts:")
+    for path, reason in problems:
+        print(f"  {path}: {reason}")
+    before = json.loads(json.dumps(data))
+    data = request_roundup_fixes(request, data, problems)
+    structural = roundup_problems(data)
+    if structural and not (drop_bullets(data, structural) and not roundup_problems(data)):
+        print("Fixes came back incomplete, keeping the original roundup")
+        data = before
+    problems = validate_roundup(data, index, cutoff, lead)
+    if problems:
+        dropped = drop_bullets(data, problems)
+        if dropped:
+            print(f"Dropped {dropped} stories that still failed validation")
+            problems = validate_roundup(data, index, cutoff, lead)
+        for path, reason in problems:
+            print(f"WARNING: publishing with {path}: {reason}")
+    return data, True
+
+def generate_roundup(articles, on_field=None):
+    """Use Claude to format the fetched articles into a roundup.
+
+    The response is streamed; on_field(key, value) is called as each
+    top-level field completes so later stages can start early.
+    """
+
+    if not articles:
+        print("No articles to format")
+        return None
+
+    today = datetime.now()
+
+    # Load yesterday's article to inform diversity rules
+    yesterday = {}
+    yesterday_names = []
+    yesterday_headline = ""
+    try:
+        with open('latest_article.json', 'r') as f:
+            yesterday = json.loads(f.read())
+            yesterday_names = yesterday.get('names', [])
+            yesterday_headline = yesterday.get('theme_headline', yesterday.get('headline', ''))
+    except Exception:
+        pass
+
+    yesterday_context = ""
+    if yesterday_names or yesterday_headline:
+        yesterday_context = f"""
+YESTERDAY'S ARTICLE (DO NOT REPEAT):
+- Headline: {yesterday_headline}
+- Featured names: {', '.join(yesterday_names)}
+- You MUST choose a DIFFERENT lead name/angle today. If yesterday led with Prince Andrew, today should lead with someone else.
+"""
 
-        response_text = response.content[0].text
+    builder = PromptBuilder(PROMPT_TOKEN_BUDGET, estimate_tokens,
+                            reserved={'instructions': estimate_tokens(ROUNDUP_INSTRUCTIONS)})
+    builder.text('date', f"TODAY'S DATE: {today.strftime('%A, %B %d, %Y')}\n")
+    index = roundup_index()
+    frequent_leads = index.lead_counts(ROUNDUP_LEAD_WINDOW)
+    builder.items('history', index.recent_lines(ROUNDUP_HISTORY_LIMIT),
+                  header="RECENT ROUNDUPS, newest first (avoid repeating old headlines):",
+                  footer=f"Most frequent leads lately: {frequent_leads}" if frequent_leads else '',
+                  trim_order=0)
+    if yesterday_context:
+        builder.text('yesterday', yesterday_context)
+    # Pre-tag people we already know so Claude only has to identify new ones
+    tagger = get_name_tagger()
+    for a in articles:
+        a['people'] = tagger.tag(a['title'])
+    # Format articles for Claude — include publish date so it can verify recency
+    builder.items('articles', [format_article_line(a) for a in articles],
+                  header="HERE ARE THE NEWS ARTICLES FETCHED FROM RSS (these are REAL articles with REAL URLs):",
+                  trim_order=1, min_items=PROMPT_MIN_ARTICLES)
+    prompt = builder.build()
+
+    print("Calling Claude API to format roundup...")
+
+    models = router.models('roundup')
+    request = {
+        'model': models[0],
+        'max_tokens': 4000,
+        'system': [{"type": "text", "text": ROUNDUP_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}}],
+        'messages': [{"role": "user", "content": prompt}],
+    }
+    cache = response_cache()
+    cache_key = cache.key(request) if cache else None
 
-        # Parse JSON
-        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
+    def check_bullet(key, index, bullet):
+        # Checked as soon as each bullet finishes streaming
+        if key in ('bullets_short', 'bullets_long'):
+            reason = bullet_problem(bullet)
+            if reason:
+                print(f"  {key}[{index}] is unusable ({reason})")
+
+    max_retries = 3
+    for attempt in range(1, max_retries + 1):
+        parser = IncrementalJSONParser(on_field=on_field, on_item=check_bullet)
+        # Only the first attempt may use the cache; retries always ask the API
+        cached = cache.get(cache_key) if cache and attempt == 1 else None
+        if cached is not None:
+            print("Using cached Claude response for identical request")
+            parser.feed(cached)
         else:
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                print(f"Attempt {attempt}: Could not find JSON in response")
-                if attempt < max_retries:
-                    continue
-                print("ERROR: No JSON found after all retries")
-                return None
+            # A retry moves up to the next model tier, if the route has one
+            attempt_request = {**request, 'model': models[min(attempt, len(models)) - 1]}
+            print(f"API attempt {attempt}/{max_retries} ({attempt_request['model']})...")
+            message = stream_claude(attempt_request, parser, attempt=attempt)
+            if not parser.done and parser.root_start is not None:
+                # Cut off (usually max_tokens): let Claude carry on from where it stopped
+                print(f"Response stopped early ({message.stop_reason}), asking Claude to continue it...")
+                stream_claude({**attempt_request, 'messages': request['messages'] + [
+                    {"role": "assistant", "content": parser.strip_trailing_whitespace()}]}, parser,
+                    purpose='continue', attempt=attempt)
+
+        data = parser.result()
+        if data is None:
+            print(f"Attempt {attempt}: Could not find JSON in response")
+            if attempt < max_retries:
+                continue
+            print("ERROR: Could not parse JSON after all retries")
+            print(f"Raw response (first 500 chars): {parser.text[:500]}")
+            return None
+        patched = parser.repaired
+        if patched:
+            print("JSON repaired")
+
+        problems = roundup_problems(data)
+        if problems:
+            print(f"Attempt {attempt}: {len(problems)} parts missing or invalid, asking Claude for just those...")
+            data = request_roundup_fixes(request, data, problems)
+            patched = True
+            problems = roundup_problems(data)
+        if not problems:
+            break
+        for path, reason in problems:
+            print(f"  {path}: {reason}")
+        if attempt < max_retries:
+            print("Roundup still incomplete, retrying API call...")
+            continue
+        print("ERROR: Could not get a complete roundup after all retries")
+        return None
 
-        try:
-            data = json.loads(json_str)
-            break  # Success
-        except json.JSONDecodeError as e:
-            print(f"Attempt {attempt}: JSON parse error: {e}")
-            # Try to repair common JSON issues
-            try:
-                # Fix trailing commas before } or ]
-                repaired = re.sub(r',\s*([}\]])', r'\1', json_str)
-                # Fix missing commas between objects/strings
-                repaired = re.sub(r'"\s*\n\s*"', '",\n"', repaired)
-                repaired = re.sub(r'}\s*\n\s*{', '},\n{', repaired)
-                data = json.loads(repaired)
-                print("JSON repaired successfully")
-                break
-            except json.JSONDecodeError:
-                if attempt < max_retries:
-                    print("JSON repair failed, retrying API call...")
-                    continue
-                print("ERROR: Could not parse JSON after all retries")
-                print(f"Raw response (first 500 chars): {response_text[:500]}")
-                return None
+    if not data.get('no_news'):
+        data, changed = enforce_roundup_rules(request, data, articles, yesterday)
+        patched = patched or changed
+
+    if cache and cached is None:
+        cache.put(cache_key, json.dumps(data) if patched else parser.text, model=request['model'])
 
     if data.get('no_news'):
         print("No significant news found today")
@@ -425,7 +903,7 @@ def create_article_html(data, today):
     # Build tags HTML - link to name pages
     tags_html = ""
     for name in data['names'][:4]:
-        name_slug = name.lower().replace(' ', '-').replace('.', '').replace("'", '')
+        name_slug = slugify(name)
         tags_html += f'                    <a href="/names/{name_slug}.html" class="article-tag">{name}</a>\n'
 
     # URL encode for share buttons
@@ -533,7 +1011,7 @@ def update_index_html(data, today):
     tags_data = ','.join([name.lower() for name in data['names'][:4]])
     tags_html = ""
     for name in data['names'][:4]:
-        name_slug = name.lower().replace(' ', '-').replace('.', '').replace("'", '')
+        name_slug = slugify(name)
         tags_html += f'                                    <a href="/names/{name_slug}.html" class="article-tag">{name}</a>\n'
 
     # Get current thumbnail version
@@ -624,13 +1102,34 @@ def update_feed_xml(data, today):
         else:
             print("WARNING: Could not find insertion point in feed.xml")
 
+# Model that wrote each bio this run, for the bio store
+bio_models = {}
+
+def claude_bio(name):
+    """Ask Claude for one name's bio, on the cheapest tier that writes a usable one."""
+    def write_bio(model):
+        # Recorded before the call so a fallback bio names the last model tried
+        bio_models[name] = model
+        text = call_llm('bio', {
+            'model': model,
+            'max_tokens': BIO_MAX_TOKENS,
+            'messages': [{"role": "user", "content": bio_prompt(name)}],
+        }).text.strip()
+        problem = bio_problem(name, text)
+        if problem:
+            print(f"  Bio for {name} from {model} {problem}")
+            return None
+        return text
+
+    text = router.run('bio', write_bio)
+    if text is None:
+        raise ValueError("no tier wrote a usable bio")
+    return text
+
 def regenerate_name_pages():
     """Regenerate all name pages after adding a new article."""
     from collections import defaultdict
 
-    def slugify(name):
-        return name.lower().replace(' ', '-').replace('.', '').replace("'", '')
-
     # Extract articles and tags
     articles = []
     for filename in os.listdir('.'):
@@ -681,40 +1180,28 @@ def regenerate_name_pages():
     os.makedirs('names', exist_ok=True)
 
     # Load existing bios
-    bios_file = 'name-bios.json'
-    try:
-        bios = json.loads(read_file(bios_file))
-    except:
-        bios = {}
+    bios = BioStore('name-bios.json', 'name-bios.jsonl')
 
     # Generate bios for any new names via Claude
     new_names = [n for n in tag_index.keys() if slugify(n) not in bios]
     if new_names:
         print(f"Generating bios for {len(new_names)} new names: {new_names}")
-        for new_name in new_names:
-            try:
-                bio_response = client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=300,
-                    messages=[{
-                        "role": "user",
-                        "content": f"""Write a 2-4 sentence factual bio about {new_name}'s documented connection to Jeffrey Epstein for a news aggregation website.
-Only include publicly verified information from court documents, flight logs, or credible news reporting.
-Use hedging language where appropriate ("according to documents," "has denied," "allegedly").
-Do NOT speculate. If the connection is minimal or unclear, say so.
-Return ONLY the bio text, no quotes or labels."""
-                    }]
-                )
-                bio_text = bio_response.content[0].text.strip()
-                bios[slugify(new_name)] = bio_text
-                print(f"  Generated bio for {new_name}")
-            except Exception as e:
-                print(f"  Failed to generate bio for {new_name}: {e}")
-                bios[slugify(new_name)] = f"{new_name} has been referenced in documents related to the Jeffrey Epstein case. Their name appears in the Epstein Files Daily coverage."
 
-        # Save updated bios
-        write_file(bios_file, json.dumps(bios, indent=2))
-        print(f"Saved {len(bios)} bios to {bios_file}")
+        def save_bio(name, text, ok):
+            # Appended to the log as each bio arrives so finished ones survive a later failure
+            bios.put(slugify(name), name, text, bio_models.get(name), status='ok' if ok else 'fallback')
+
+        generate_bios(new_names, claude_bio, save_bio, workers=BIO_WORKERS)
+
+    # Retry a batch of fallback or stale bios; healthy ones are left alone
+    if BIO_REFRESH_BATCH:
+        refresh_bios(bios, claude_bio, bio_models.get, BIO_REFRESH_BATCH, BIO_MAX_AGE_DAYS,
+                     names={slugify(n): n for n in tag_index}, workers=BIO_WORKERS)
+    if bios.save_snapshot():
+        print(f"Saved {len(bios)} bios to name-bios.json")
+    compacted = bios.compact()
+    if compacted:
+        print(f"Compacted name-bios.jsonl, dropped {compacted} superseded lines")
 
     # Generate each name page
     for name, name_articles in tag_index.items():
@@ -757,7 +1244,7 @@ Return ONLY the bio text, no quotes or labels."""
         ])
 
         # Get bio for this person
-        person_bio = bios.get(slug, '')
+        person_bio = bios.get(slug) or ''
         if person_bio:
             meta_desc = person_bio[:155].rsplit(' ', 1)[0] + '...'
             bio_section = f'''
@@ -1004,6 +1491,7 @@ Return ONLY the bio text, no quotes or labels."""
         write_file(f'names/{slug}.html', html)
 
     print(f"Regenerated {len(tag_index)} name pages")
+    return len(tag_index)
 
 def update_sitemap(data, today):
     """Add the new article to sitemap.xml."""
@@ -1142,7 +1630,8 @@ Select everything below this box, copy, and paste into Substack's editor.
     }
 
 
-def main():
+def main(resume=False):
+    """Generate today's roundup; resume=True reruns it even if today's page exists."""
     print("=" * 50)
     print("EPSTEIN FILES DAILY - Daily Roundup Generator")
     print("=" * 50)
@@ -1154,55 +1643,164 @@ def main():
 
     print(f"\nGenerating roundup for: {date_str}")
 
+    checkpoints = Checkpoints(CHECKPOINT_DIR, today.strftime('%Y-%m-%d'), enabled=CHECKPOINTS)
+    checkpoints.prune(CHECKPOINT_KEEP_DAYS)
+
     # Check if already generated today
     if f"{filename_base}.html" in get_existing_roundups():
-        print(f"Roundup for today already exists: {filename_base}.html")
-        return
+        if resume or (checkpoints.started and not checkpoints.complete):
+            print(f"Resuming today's run, {filename_base}.html exists but later stages may not have finished")
+        else:
+            print(f"Roundup for today already exists: {filename_base}.html")
+            return
+
+    report = RunReport(date=today.strftime('%Y-%m-%d'), slug=filename_base)
+    llm_ledger.new_run()
+    try:
+        report.status = run_pipeline(report, today, date_str, filename_base, checkpoints)
+    except BaseException:
+        report.status = 'error'
+        raise
+    finally:
+        report.write(RUN_REPORT_PATH)
+        if PERF_LEDGER:
+            append_run(DEFAULT_LEDGER, report.as_dict(), archive_size())
+
+def run_pipeline(report, today, date_str, filename_base, checkpoints):
+    """Run every stage of the daily roundup; returns the run status."""
+
+    def checkpointed(span, stage, inputs, produce, products=(), restore=()):
+        output, resumed = checkpoints.run(stage, inputs, produce, products, restore)
+        if resumed:
+            print(f"  Reusing the {stage} stage from an earlier run today")
+            span.extra['resumed'] = True
+        return output
+
+    # Opened here rather than in the fetch stage, which a resumed run may skip
+    store = news_store()
+    if store:
+        store.begin_run()
 
     # Step 1: Fetch news from RSS (Claude API cannot search the web!)
     print("\nStep 1: Fetching news from Google News RSS...")
-    articles = fetch_news_from_rss()
+    with report.stage('fetch') as span:
+        articles = checkpointed(span, 'fetch', [filename_base, RSS_QUERIES], fetch_news_from_rss)
+        span.items = len(articles)
 
     if not articles:
+        checkpoints.discard('fetch')
         print("ERROR: Could not fetch any articles from RSS")
-        return
+        return 'no_articles'
 
     # Step 2: Use Claude to format the articles
     print("\nStep 2: Using Claude to format articles...")
-    roundup_data = generate_roundup(articles)
+    thumb_filename = f"images/{filename_base}.png"
+    thumbnail_pool = ThreadPoolExecutor(max_workers=1)
+    early_fields = {}
+    early_thumbnail = {}
+
+    def start_thumbnail_early(key, value):
+        # The headline and lead name stream in first, so the thumbnail can be
+        # drawn while Claude is still writing the bullets
+        early_fields[key] = value
+        if 'future' not in early_thumbnail and 'theme_headline' in early_fields and 'featured_name' in early_fields:
+            args = (date_str, early_fields['theme_headline'], thumb_filename, early_fields['featured_name'])
+            early_thumbnail['args'] = args
+            early_thumbnail['future'] = thumbnail_pool.submit(generate_thumbnail, *args)
+
+    with report.stage('roundup') as span:
+        roundup_data = checkpointed(span, 'roundup', [articles, ROUNDUP_INSTRUCTIONS],
+                                    lambda: generate_roundup(articles, on_field=start_thumbnail_early))
+        span.items = len(roundup_data['bullets_long']) if roundup_data else 0
+        if roundup_data:
+            # How well local tagging matches Claude's names, before anything relies on it
+            agreement = get_name_tagger().agreement(roundup_data)
+            print(f"Name tagger: {agreement['tagged']} known people tagged locally, precision {agreement['precision']}, "
+                  f"recall {agreement['recall_known']}; new names: {', '.join(agreement['unknown_names']) or 'none'}")
+            span.extra['name_tagger'] = agreement
+        cached = llm_usage.get('cache_read_input_tokens', 0)
+        written = llm_usage.get('cache_creation_input_tokens', 0)
+        uncached = llm_usage.get('input_tokens', 0)
+        if cached or written or uncached:
+            print(f"Prompt cache: {cached} input tokens read from cache, {written} written, {uncached} uncached")
+        span.extra.update(cached_input_tokens=cached, cache_write_tokens=written, uncached_input_tokens=uncached)
+        span.extra.update(llm_ledger.summary('roundup'))
+        cache = response_cache()
+        if cache:
+            span.extra['llm_cache_hits'] = cache.hits
+            cache.report()
+            cache.evict()
 
     if not roundup_data:
+        checkpoints.discard('roundup')
+        thumbnail_pool.shutdown()
+        if 'future' in early_thumbnail and os.path.exists(thumb_filename):
+            os.remove(thumb_filename)
         print("No roundup generated")
-        return
+        return 'no_roundup'
 
     print(f"\nTheme: {roundup_data['theme_headline']}")
     print(f"Names: {', '.join(roundup_data['names'])}")
     print(f"Bullets: {len(roundup_data['bullets_short'])}")
 
     # Generate thumbnail
-    thumb_filename = f"images/{filename_base}.png"
-    featured_name = roundup_data.get('featured_name', roundup_data['names'][0] if roundup_data['names'] else '')
-    generate_thumbnail(date_str, roundup_data['theme_headline'], thumb_filename, featured_name)
+    with report.stage('thumbnail') as span:
+        featured_name = roundup_data.get('featured_name', roundup_data['names'][0] if roundup_data['names'] else '')
+        args = (date_str, roundup_data['theme_headline'], thumb_filename, featured_name)
+
+        def draw_thumbnail():
+            if early_thumbnail.get('args') == args:
+                early_thumbnail['future'].result()
+                span.extra['started_early'] = True
+            else:
+                if 'future' in early_thumbnail:
+                    early_thumbnail['future'].exception()  # let the stale one finish before overwriting it
+                generate_thumbnail(*args)
+
+        checkpointed(span, 'thumbnail', list(args), draw_thumbnail, products=[thumb_filename])
+    thumbnail_pool.shutdown()
+
+    # Inputs shared by the stages that publish the roundup
+    published = [filename_base, roundup_data]
 
     # Create article HTML
-    article_html = create_article_html(roundup_data, today)
-    write_file(f"{filename_base}.html", article_html)
-    print(f"Created: {filename_base}.html")
+    with report.stage('article_html') as span:
+        def write_article():
+            article_html = create_article_html(roundup_data, today)
+            write_file(f"{filename_base}.html", article_html)
+            print(f"Created: {filename_base}.html")
+            return article_html
+
+        checkpointed(span, 'article_html', published, write_article, products=[f"{filename_base}.html"])
+        roundup_index().add(filename_base, today.strftime('%Y-%m-%d'), roundup_data['theme_headline'],
+                          roundup_data.get('featured_name', ''), roundup_data['names'][:4])
+        roundup_index().save()
 
     # Update index.html
-    update_index_html(roundup_data, today)
+    with report.stage('index') as span:
+        checkpointed(span, 'index', published, lambda: update_index_html(roundup_data, today),
+                     products=['index.html'], restore=['index.html'])
 
     # Update RSS feed
-    update_feed_xml(roundup_data, today)
+    with report.stage('feed') as span:
+        checkpointed(span, 'feed', published, lambda: update_feed_xml(roundup_data, today),
+                     products=['feed.xml'], restore=['feed.xml'])
 
     # Update sitemap
-    update_sitemap(roundup_data, today)
+    with report.stage('sitemap') as span:
+        checkpointed(span, 'sitemap', published, lambda: update_sitemap(roundup_data, today),
+                     products=['sitemap.xml'], restore=['sitemap.xml'])
 
     # Regenerate name pages
-    regenerate_name_pages()
+    with report.stage('name_pages') as span:
+        name_pages = [f"names/{slugify(n)}.html" for n in roundup_data['names'][:4]]
+        span.items = checkpointed(span, 'name_pages', published, regenerate_name_pages, products=name_pages)
+        span.extra.update(llm_ledger.summary('name_pages'))
 
     # Generate Substack cross-post content
-    substack_content = generate_substack_post(roundup_data, today)
+    with report.stage('substack') as span:
+        substack_content = checkpointed(span, 'substack', published,
+                                        lambda: generate_substack_post(roundup_data, today))
 
     # Save info for workflow
     latest_info = {
@@ -1214,13 +1812,19 @@ def main():
         "substack_subject": substack_content['subject'],
         "substack_draft_html": substack_content['draft_html'],
         "theme_headline": roundup_data['theme_headline'],
+        "featured_name": roundup_data.get('featured_name', ''),
         "names": roundup_data.get('names', [])[:4]
     }
     write_file('latest_article.json', json.dumps(latest_info))
 
+    if store:
+        store.finish_run()
+    checkpoints.finish()
+
     print("\n" + "=" * 50)
     print("ROUNDUP GENERATED SUCCESSFULLY")
     print("=" * 50)
+    return 'success'
 
 if __name__ == "__main__":
     main()
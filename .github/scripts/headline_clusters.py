@@ -0,0 +1,83 @@
+"""
+Near-duplicate headline clustering for the RSS fetcher.
+
+The same wire story is often syndicated by a dozen outlets with slightly
+different headlines ("Maxwell appeal rejected - Reuters" vs "Ghislaine
+Maxwell's appeal rejected by court - BBC"). Exact title matching keeps all
+of them; this groups them with MinHash signatures over word shingles and
+LSH banding, so only candidate pairs that share a band are compared and the
+whole pass stays roughly linear in the number of headlines.
+
+Each cluster keeps its first article (the order the caller passed in) as
+the representative and lists the others under 'alternates'.
+"""
+
+import random
+import re
+import zlib
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.5
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(1234)  # fixed seed so clusters are identical across runs
+_PERMS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)]
+
+
+def _shingles(title):
+    # Google News appends " - Outlet" to every title; it is not part of the story
+    title = re.sub(r'\s+-\s+[^-]+$', '', title)
+    words = re.sub(r'[^\w\s]', ' ', title.lower()).split()
+    if len(words) < 2:
+        return set(words)
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def _signature(shingles):
+    hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles] or [0]
+    return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMS]
+
+
+def _jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def cluster_headlines(articles, threshold=SIMILARITY_THRESHOLD):
+    """Collapse near-duplicate headlines, returning one article per story.
+
+    Representatives keep their original order and gain an 'alternates'
+    list of {'source', 'url'} for the other outlets that ran the story.
+    """
+    shingle_sets = [_shingles(a['title']) for a in articles]
+    parent = list(range(len(articles)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    for i, shingles in enumerate(shingle_sets):
+        sig = _signature(shingles)
+        for band in range(BANDS):
+            key = (band, tuple(sig[band * ROWS:(band + 1) * ROWS]))
+            for j in buckets.setdefault(key, []):
+                if find(i) != find(j) and _jaccard(shingles, shingle_sets[j]) >= threshold:
+                    # Keep the earlier article as the root so it stays the representative
+                    ri, rj = find(i), find(j)
+                    parent[max(ri, rj)] = min(ri, rj)
+            buckets[key].append(i)
+
+    clusters = {}
+    for i, article in enumerate(articles):
+        root = find(i)
+        if root not in clusters:
+            clusters[root] = dict(article, alternates=[])
+        else:
+            clusters[root]['alternates'].append({'source': article['source'], 'url': article['url']})
+    return list(clusters.values())
@@ -0,0 +1,113 @@
+"""
+Resolve Google News redirect links to the publisher's own URL.
+
+Links in Google News RSS point at news.google.com, which redirects to the
+real article, so every reader click on a bullet, feed item or Substack link
+pays an extra hop. Links are resolved concurrently by following redirects
+only while they stay on a redirector host; the publisher page itself is
+never downloaded.
+
+Publisher URLs are kept in a dbm key-value file so each link is looked up
+once across all runs. Only a chain of 3xx redirects that ends off Google's
+hosts counts as resolved. Network errors, 4xx/5xx answers and redirects to
+other Google pages (consent.google.com, say) are not cached, so those links
+keep their Google URL for now and are tried again next run.
+"""
+
+import dbm
+import os
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+GOOGLE_DOMAINS = ('google.com',)
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class LinkResolver:
+    def __init__(self, path, redirect_hosts, user_agent, workers=8, timeout=10, max_hops=5, pool=None):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.redirect_hosts = set(redirect_hosts)
+        self.user_agent = user_agent
+        self.workers = workers
+        self.timeout = timeout
+        self.max_hops = max_hops
+        self.opener = urllib.request.build_opener(_NoRedirect)
+        self.pool = pool  # optional http_pool.HTTPPool for keep-alive connections
+
+    def _is_redirector(self, url):
+        return urllib.parse.urlsplit(url).netloc.lower() in self.redirect_hosts
+
+    def _is_google(self, url):
+        host = (urllib.parse.urlsplit(url).hostname or '').lower()
+        return any(host == d or host.endswith('.' + d) for d in GOOGLE_DOMAINS)
+
+    def _resolve_one(self, url):
+        """Follow redirects hop by hop; return the publisher URL, or None if there isn't one."""
+        current = url
+        for _ in range(self.max_hops):
+            if not self._is_redirector(current):
+                break
+            try:
+                status, headers = self._head(current)
+            except urllib.error.HTTPError as e:
+                status, headers = e.code, e.headers
+            location = headers.get('Location') if status in (301, 302, 303, 307, 308) else None
+            if not location:
+                return None  # e.g. 200 or 503 on the redirector itself: nothing to follow
+            current = urllib.parse.urljoin(current, location)
+        if current == url or self._is_redirector(current) or self._is_google(current):
+            return None
+        return current
+
+    def _head(self, url):
+        headers = {'User-Agent': self.user_agent}
+        if self.pool:
+            with self.pool.request(url, headers, timeout=self.timeout, method='HEAD',
+                                   follow_redirects=False) as response:
+                return response.status, response.headers
+        req = urllib.request.Request(url, method='HEAD', headers=headers)
+        with self.opener.open(req, timeout=self.timeout) as response:
+            return response.status, response.headers
+
+    def resolve_all(self, urls):
+        """Return {url: publisher_url} for every redirector link in urls."""
+        pending = [u for u in dict.fromkeys(urls) if self._is_redirector(u)]
+        mapping = {}
+        with dbm.open(self.path, 'c') as db:
+            for url in pending:
+                cached = db.get(url)
+                if cached is not None:
+                    mapping[url] = cached.decode('utf-8')
+            todo = [u for u in pending if u not in mapping]
+
+            started = time.monotonic()
+            failed = 0
+            if todo:
+                with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+                    for url, result in zip(todo, executor.map(self._try_resolve, todo)):
+                        if result is None:
+                            failed += 1  # not cached, so it is looked up again next run
+                            continue
+                        mapping[url] = result
+                        db[url] = result.encode('utf-8')
+
+        resolved = sum(1 for u in pending if mapping.get(u, u) != u)
+        print(f"Resolved {resolved}/{len(pending)} redirect links "
+              f"({len(pending) - len(todo)} cached, {len(todo)} looked up in {time.monotonic() - started:.1f}s, "
+              f"{failed} unresolved)")
+        return mapping
+
+    def _try_resolve(self, url):
+        try:
+            return self._resolve_one(url)
+        except Exception as e:
+            print(f"  Could not resolve {url}: {e}")
+            return None
@@ -0,0 +1,204 @@
+"""
+LLM backends for the pipeline: the real Anthropic client, record/replay,
+and a deterministic offline fake.
+
+All three take the same request dict that is passed to messages.create
+(model, max_tokens, messages, ...) and return a Completion:
+
+    backend.create(request)           -> Completion
+    backend.stream(request, on_text)  -> Completion, calling on_text(chunk)
+                                         as the text arrives
+
+Pick one with LLM_BACKEND:
+
+    anthropic  (default) the Anthropic SDK; imported and constructed on the
+               first call, so importing generate_article needs neither the
+               SDK nor an API key
+    record     the Anthropic SDK, saving every response under LLM_FIXTURES_DIR
+    replay     serve responses saved by record; fails on an unseen request
+    fake       canned roundups built from the prompt's own articles, and
+               canned bios; never touches the network (LLM_FAKE_LATENCY adds
+               a delay per call, in seconds)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+from fileutil import write_atomic
+from response_cache import ResponseCache
+
+DEFAULT_FIXTURES_DIR = '.github/fixtures/llm'
+
+
+class Completion:
+    def __init__(self, text, stop_reason='end_turn', usage=None, model=None):
+        self.text = text
+        self.stop_reason = stop_reason
+        self.usage = usage or {}
+        self.model = model
+
+
+def _usage(message):
+    usage = getattr(message, 'usage', None)
+    return {
+        key: getattr(usage, key, 0) or 0
+        for key in ('input_tokens', 'output_tokens', 'cache_read_input_tokens', 'cache_creation_input_tokens')
+    }
+
+
+def _chunks(text, size=16):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+class AnthropicBackend:
+    name = 'anthropic'
+
+    def __init__(self):
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                from anthropic import Anthropic
+                self._client = Anthropic()
+            return self._client
+
+    def create(self, request):
+        message = self.client.messages.create(**request)
+        return Completion(message.content[0].text, message.stop_reason, _usage(message), message.model)
+
+    def stream(self, request, on_text):
+        with self.client.messages.stream(**request) as stream:
+            for text in stream.text_stream:
+                on_text(text)
+            message = stream.get_final_message()
+        text = ''.join(block.text for block in message.content if getattr(block, 'text', None))
+        return Completion(text, message.stop_reason, _usage(message), message.model)
+
+
+class RecordReplayBackend:
+    """Save responses from an inner backend (record) or serve saved ones (replay)."""
+
+    def __init__(self, fixtures_dir, inner=None):
+        self.fixtures_dir = fixtures_dir
+        self.inner = inner  # None means replay only
+        self.name = 'record' if inner else 'replay'
+        if inner:
+            os.makedirs(fixtures_dir, exist_ok=True)
+
+    def _path(self, request):
+        return os.path.join(self.fixtures_dir, ResponseCache.key(request) + '.json')
+
+    def _load(self, request):
+        path = self._path(request)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except OSError:
+            raise LookupError(f"no recorded response for this request ({path}); run with LLM_BACKEND=record first")
+        return Completion(saved['text'], saved.get('stop_reason', 'end_turn'), saved.get('usage'), saved.get('model'))
+
+    def _save(self, request, completion):
+        write_atomic(self._path(request), json.dumps({
+            'request': request, 'text': completion.text, 'stop_reason': completion.stop_reason,
+            'usage': completion.usage, 'model': completion.model}, indent=1, ensure_ascii=False))
+
+    def create(self, request):
+        if not self.inner:
+            return self._load(request)
+        completion = self.inner.create(request)
+        self._save(request, completion)
+        return completion
+
+    def stream(self, request, on_text):
+        if not self.inner:
+            completion = self._load(request)
+            for chunk in _chunks(completion.text):
+                on_text(chunk)
+            return completion
+        completion = self.inner.stream(request, on_text)
+        self._save(request, completion)
+        return completion
+
+
+FAKE_NAMES = ["Ghislaine Maxwell", "Les Wexner", "Prince Andrew", "Bill Gates", "Virginia Giuffre", "Jean-Luc Brunel"]
+ARTICLE_LINE = re.compile(r'^- (.+?) \(Source: ([^,]+), Published: .*?, URL: (\S+?)\)', re.MULTILINE)
+BIO_NAME = re.compile(r"factual bio about (.+?)'s documented connection")
+
+
+class FakeBackend:
+    """Deterministic offline stand-in: same request, same response."""
+
+    name = 'fake'
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+
+    def _respond(self, request):
+        messages = request['messages']
+        prompt = messages[0]['content']
+        if isinstance(prompt, list):
+            prompt = ''.join(block.get('text', '') for block in prompt)
+        bio = BIO_NAME.search(prompt)
+        if bio:
+            name = bio.group(1)
+            return (f"{name} has been named in reporting on the Jeffrey Epstein case, according to documents "
+                    f"cited by several outlets. {name} has not been charged with any related crime.")
+        if len(messages) > 1 and messages[-1]['role'] == 'user':
+            return '{}'  # a request for fixes; the fake roundup never needs any
+        text = "```json\n" + json.dumps(self._roundup(prompt), indent=2) + "\n```"
+        if messages[-1]['role'] == 'assistant':
+            return text[len(messages[-1]['content']):]  # continue a prefill
+        return text
+
+    @staticmethod
+    def _roundup(prompt):
+        articles = ARTICLE_LINE.findall(prompt)[:5]
+        if len(articles) < 4:
+            return {"no_news": True}
+        short, full, names = [], [], []
+        for i, (title, source, url) in enumerate(articles):
+            name = next((n for n in FAKE_NAMES if n.lower() in title.lower()), FAKE_NAMES[i % len(FAKE_NAMES)])
+            if name not in names:
+                names.append(name)
+            short.append({"name": name, "text": f"{title}.", "source": source, "url": url})
+            full.append({"name": name, "text": f"{title}. {source} reports new details on the case.",
+                         "source": source, "url": url})
+        return {
+            "theme_headline": f"{names[0]} Back in the Headlines",
+            "featured_name": names[0],
+            "names": names,
+            "bullets_short": short,
+            "bullets_long": full,
+        }
+
+    def create(self, request):
+        if self.latency:
+            time.sleep(self.latency)
+        text = self._respond(request)
+        return Completion(text, usage={'input_tokens': len(json.dumps(request)) // 4, 'output_tokens': len(text) // 4},
+                          model=request.get('model'))
+
+    def stream(self, request, on_text):
+        completion = self.create(request)
+        for chunk in _chunks(completion.text):
+            on_text(chunk)
+        return completion
+
+
+def make_backend(name, fixtures_dir=DEFAULT_FIXTURES_DIR, fake_latency=0.0):
+    if name == 'anthropic':
+        return AnthropicBackend()
+    if name == 'record':
+        return RecordReplayBackend(fixtures_dir, inner=AnthropicBackend())
+    if name == 'replay':
+        return RecordReplayBackend(fixtures_dir)
+    if name == 'fake':
+        return FakeBackend(fake_latency)
+    raise ValueError(f"unknown LLM_BACKEND {name!r} (expected anthropic, record, replay or fake)")
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Ledger of every model call: tokens, latency and what the call was for.
+
+Every roundup, continuation, repair and bio call appends one compact JSON
+line:
+
+    ts     unix time the call started       purpose  roundup, continue, repair, bio
+    model  model that answered              backend  anthropic, record, replay, fake
+    in     uncached input tokens            out      output tokens
+    cr     input tokens read from cache     cw       input tokens written to cache
+    ttft   ms to the first streamed text    ms       total ms
+    try    attempt number within the stage  ok       false if the call raised
+
+The report prices the tokens and groups calls by pipeline stage and by
+day, so it is clear where time and money go:
+
+    python .github/scripts/llm_ledger.py report [--days 30] [--backend anthropic]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from perf_ledger import load, percentile
+
+DEFAULT_LLM_LEDGER = os.environ.get('LLM_LEDGER_PATH', '.github/perf/llm-calls.jsonl')
+
+# Pipeline stage that makes each kind of call
+PURPOSE_STAGE = {'roundup': 'roundup', 'continue': 'roundup', 'repair': 'roundup', 'bio': 'name_pages'}
+
+# USD per million tokens: input, output, cache read, cache write (5 minute TTL)
+PRICES = {
+    'claude-sonnet-4-20250514': (3.00, 15.00, 0.30, 3.75),
+    'claude-3-5-haiku-20241022': (0.80, 4.00, 0.08, 1.00),
+}
+
+
+def cost(record):
+    """Price of one ledger record in USD (0 for models without a known price)."""
+    prices = PRICES.get(record.get('model'))
+    if not prices:
+        return 0.0
+    tokens = (record.get('in', 0), record.get('out', 0), record.get('cr', 0), record.get('cw', 0))
+    return sum(t * p for t, p in zip(tokens, prices)) / 1e6
+
+
+class LLMLedger:
+    """Times model calls and appends them to the ledger (path=None keeps them in memory only)."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.records = []
+        self.lock = threading.Lock()
+
+    def call(self, purpose, backend, request, on_text=None, attempt=1):
+        """Run backend.create(request), or backend.stream(request, on_text) if on_text is given."""
+        started = time.time()
+        clock = time.perf_counter()
+        first_text = []
+
+        def on_chunk(text):
+            if not first_text:
+                first_text.append(time.perf_counter())
+            on_text(text)
+
+        record = {'ts': int(started), 'purpose': purpose, 'model': request.get('model'),
+                  'backend': getattr(backend, 'name', None), 'try': attempt}
+        try:
+            completion = backend.stream(request, on_chunk) if on_text else backend.create(request)
+        except Exception:
+            record.update(ms=round((time.perf_counter() - clock) * 1000), ok=False)
+            self._append(record)
+            raise
+        usage = completion.usage
+        record.update({
+            'model': completion.model or record['model'],
+            'in': usage.get('input_tokens', 0),
+            'out': usage.get('output_tokens', 0),
+            'cr': usage.get('cache_read_input_tokens', 0),
+            'cw': usage.get('cache_creation_input_tokens', 0),
+            'ttft': round((first_text[0] - clock) * 1000) if first_text else None,
+            'ms': round((time.perf_counter() - clock) * 1000),
+            'ok': True,
+        })
+        self._append(record)
+        return completion
+
+    def _append(self, record):
+        with self.lock:
+            self.records.append(record)
+            if self.path:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def new_run(self):
+        """Forget the in-memory records so summary() covers only the next run."""
+        with self.lock:
+            self.records = []
+
+    def summary(self, stage=None):
+        """Calls, tokens and cost of this run's records, optionally for one stage."""
+        with self.lock:
+            records = [r for r in self.records if stage is None or PURPOSE_STAGE.get(r['purpose']) == stage]
+        return {
+            'llm_calls': len(records),
+            'llm_output_tokens': sum(r.get('out', 0) for r in records),
+            'llm_cost_usd': round(sum(cost(r) for r in records), 4),
+        }
+
+
+def _row(label, records):
+    ms = [r['ms'] for r in records]
+    ttft = [r['ttft'] for r in records if r.get('ttft') is not None]
+    tokens_in = sum(r.get('in', 0) + r.get('cr', 0) + r.get('cw', 0) for r in records)
+    cached = sum(r.get('cr', 0) for r in records)
+    failed = sum(not r.get('ok', True) for r in records)
+    retries = sum(r.get('try', 1) > 1 for r in records)
+    return (f"{label:<12} {len(records):>6} {failed:>6} {retries:>7} {tokens_in:>10} "
+            f"{100 * cached / tokens_in if tokens_in else 0:>6.0f}% {sum(r.get('out', 0) for r in records):>8} "
+            f"{sum(cost(r) for r in records):>9.4f} {percentile(ms, 50) / 1000:>7.2f} {percentile(ms, 95) / 1000:>7.2f} "
+            f"{(percentile(ttft, 50) / 1000 if ttft else 0):>7.2f}")
+
+
+def cmd_report(args):
+    records = load(args.ledger)
+    if args.days:
+        since = (datetime.now() - timedelta(days=args.days)).timestamp()
+        records = [r for r in records if r.get('ts', 0) >= since]
+    if args.backend:
+        records = [r for r in records if r.get('backend') == args.backend]
+    if not records:
+        print(f"No model calls in {args.ledger}")
+        return 0
+
+    header = (f"{'':<12} {'calls':>6} {'failed':>6} {'retries':>7} {'input tok':>10} {'cached':>7} "
+              f"{'output':>8} {'cost $':>9} {'p50 s':>7} {'p95 s':>7} {'ttft s':>7}")
+    groups = {
+        'stage': lambda r: PURPOSE_STAGE.get(r['purpose'], r['purpose']),
+        'purpose': lambda r: r['purpose'],
+        'model': lambda r: r.get('model') or '?',
+        'day': lambda r: datetime.fromtimestamp(r['ts']).strftime('%Y-%m-%d'),
+    }
+    for name in args.by.split(','):
+        grouped = defaultdict(list)
+        for r in records:
+            grouped[groups[name](r)].append(r)
+        print(f"\nBy {name}:")
+        print(header)
+        for label in sorted(grouped):
+            print(_row(label, grouped[label]))
+    print()
+    print(_row('total', records))
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ledger', default=DEFAULT_LLM_LEDGER)
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('report', help='cost and latency per stage and per day')
+    p.add_argument('--days', type=int, default=30, help='only calls from the last N days (0 for all)')
+    p.add_argument('--backend', default=None, help='only calls to this backend, e.g. anthropic')
+    p.add_argument('--by', default='stage,purpose,day', help='comma-separated: stage, purpose, model, day')
+    p.set_defaults(func=cmd_report)
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
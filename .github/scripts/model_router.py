@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Route each kind of model call to a tier, falling back when output is bad.
+
+A 2-4 sentence bio or a handful of bullet fixes doesn't need the model
+that composes the whole roundup. Each task has a list of tiers, cheapest
+first. The call goes to the first tier, and if it raises or its output
+fails the task's validation, it is retried one tier up:
+
+    roundup   strong          (a retry of the whole roundup also uses the next tier, if any)
+    repair    strong
+    bio       fast, strong
+
+Repairs stay on the roundup's tier because they resend its cached system
+prompt, and prompt caches are per model: on the fast tier the prefix is
+also below the minimum cacheable length, so every repair would pay full
+input price for it.
+
+Override with LLM_ROUTES="bio=fast,strong;repair=fast,strong" and the models
+behind the tiers with LLM_MODEL_FAST / LLM_MODEL_STRONG.
+
+The benchmark runs bios through a fake backend whose latency, output
+length and failure rate depend on the tier, and compares the routes:
+
+    python .github/scripts/model_router.py bench [--calls 40] [--fast-failure-rate 0.1]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import threading
+import time
+
+from llm_backend import Completion, FakeBackend
+from llm_ledger import LLMLedger, cost
+from perf_ledger import percentile
+
+TIERS = {
+    'fast': os.environ.get('LLM_MODEL_FAST', 'claude-3-5-haiku-20241022'),
+    'strong': os.environ.get('LLM_MODEL_STRONG', 'claude-sonnet-4-20250514'),
+}
+DEFAULT_ROUTES = {
+    'roundup': ['strong'],
+    'repair': ['strong'],
+    'bio': ['fast', 'strong'],
+}
+
+
+def parse_routes(spec, routes=DEFAULT_ROUTES):
+    """Overlay "task=tier,tier;task=tier" on the default routes."""
+    routes = {task: list(tiers) for task, tiers in routes.items()}
+    for part in filter(None, (p.strip() for p in (spec or '').split(';'))):
+        task, _, tiers = part.partition('=')
+        tiers = [t.strip() for t in tiers.split(',') if t.strip()]
+        unknown = [t for t in tiers if t not in TIERS]
+        if not tiers or unknown:
+            raise ValueError(f"bad LLM_ROUTES entry {part!r} (tiers are {', '.join(TIERS)})")
+        routes[task.strip()] = tiers
+    return routes
+
+
+class ModelRouter:
+    def __init__(self, routes=DEFAULT_ROUTES, tiers=TIERS):
+        self.routes = routes
+        self.tiers = tiers
+        self.lock = threading.Lock()
+        self.fallbacks = {}
+
+    def models(self, task):
+        return [self.tiers[tier] for tier in self.routes.get(task, ['strong'])]
+
+    def run(self, task, attempt):
+        """Call attempt(model) on each tier of task until it returns something other than None.
+
+        attempt returns None when the output fails validation. An exception on
+        the last tier propagates; None from the last tier is returned as is.
+        """
+        models = self.models(task)
+        for i, model in enumerate(models):
+            last = i == len(models) - 1
+            try:
+                result = attempt(model)
+            except Exception as e:
+                if last:
+                    raise
+                print(f"  {task} on {model} failed ({e}), falling back to {models[i + 1]}")
+                self._count_fallback(task)
+                continue
+            if result is not None or last:
+                return result
+            print(f"  {task} on {model} failed validation, falling back to {models[i + 1]}")
+            self._count_fallback(task)
+        return None
+
+    def _count_fallback(self, task):
+        with self.lock:
+            self.fallbacks[task] = self.fallbacks.get(task, 0) + 1
+
+
+class TieredFakeBackend(FakeBackend):
+    """FakeBackend with tier-dependent latency, and fast-tier answers that sometimes fail validation."""
+
+    # seconds to first token, seconds per output token
+    SPEED = {'fast': (0.35, 0.004), 'strong': (0.9, 0.012)}
+
+    def __init__(self, fast_failure_rate=0.1, scale=1.0, seed=0):
+        super().__init__()
+        self.fast_failure_rate = fast_failure_rate
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.tier_of = {model: tier for tier, model in TIERS.items()}
+
+    def create(self, request):
+        tier = self.tier_of.get(request.get('model'), 'strong')
+        text = self._respond(request)
+        with self.rng_lock:
+            jitter = self.rng.uniform(0.8, 1.3)
+            failed = tier == 'fast' and self.rng.random() < self.fast_failure_rate
+        if failed:
+            text = "I'm not able to verify that."
+        first, per_token = self.SPEED[tier]
+        output_tokens = len(text) // 4
+        time.sleep((first + per_token * output_tokens) * jitter * self.scale)
+        return Completion(text, usage={'input_tokens': len(str(request)) // 4, 'output_tokens': output_tokens},
+                          model=request.get('model'))
+
+
+def cmd_bench(args):
+    from bio_generator import BIO_MAX_TOKENS, bio_problem, bio_prompt, generate_bios
+
+    names = [f"Person Number{i}" for i in range(args.calls)]
+    print(f"{args.calls} bios, fast tier failure rate {args.fast_failure_rate:.0%}, latency scale {args.scale}")
+    print(f"{'route':<14} {'p50 s':>7} {'p95 s':>7} {'total s':>8} {'cost $':>9} {'fallbacks':>9} {'failed':>7}")
+    for label, tiers in (('strong', ['strong']), ('fast', ['fast']), ('fast,strong', ['fast', 'strong'])):
+        backend = TieredFakeBackend(args.fast_failure_rate, args.scale, args.seed)
+        router = ModelRouter({'bio': tiers})
+        ledger = LLMLedger()
+        latencies = []
+
+        def complete(name):
+            started = time.perf_counter()
+
+            def attempt(model):
+                request = {'model': model, 'max_tokens': BIO_MAX_TOKENS,
+                           'messages': [{"role": "user", "content": bio_prompt(name)}]}
+                text = ledger.call('bio', backend, request).text.strip()
+                return None if bio_problem(name, text) else text
+
+            try:
+                return router.run('bio', attempt) or ''
+            finally:
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, failed = generate_bios(names, complete, lambda *a: None, workers=args.workers)
+        total = time.perf_counter() - started
+        print(f"{label:<14} {percentile(latencies, 50):>7.2f} {percentile(latencies, 95):>7.2f} {total:>8.2f} "
+              f"{sum(cost(r) for r in ledger.records):>9.4f} {router.fallbacks.get('bio', 0):>9} {failed:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('bench', help='compare bio routes against a tiered fake backend')
+    p.add_argument('--calls', type=int, default=40)
+    p.add_argument('--workers', type=int, default=4)
+    p.add_argument('--fast-failure-rate', type=float, default=0.1)
+    p.add_argument('--scale', type=float, default=1.0, help='multiply every fake latency by this')
+    p.add_argument('--seed', type=int, default=0)
+    p.set_defaults(func=cmd_bench)
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
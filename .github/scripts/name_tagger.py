@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tag known people in headlines and bullets without asking the model.
+
+The gazetteer is every person with a bio in name-bios.json, spelled the way
+the published tags spell them, plus a few common aliases (surnames that are
+unambiguous in this coverage, titles, spellings without diacritics). All
+of them are compiled into one regex built from a character trie, so a
+headline is scanned once no matter how many names are known, and the
+longest alias wins. Matching is case-sensitive: names in headlines are
+capitalized, while words like "gates" are not.
+
+agreement() compares the local tags with the names the model returned so
+the tagger's precision can be tracked before anything relies on it.
+
+    python .github/scripts/name_tagger.py tag "Maxwell appeal rejected as Wexner testifies"
+    python .github/scripts/name_tagger.py bench [--items 10000]
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+
+# alias -> canonical name; only used when the canonical name is known
+ALIASES = {
+    'Maxwell': 'Ghislaine Maxwell',
+    'Wexner': 'Les Wexner',
+    'Leslie Wexner': 'Les Wexner',
+    'Duke of York': 'Prince Andrew',
+    'Giuffre': 'Virginia Giuffre',
+    'Virginia Roberts Giuffre': 'Virginia Giuffre',
+    'Brunel': 'Jean-Luc Brunel',
+    'Jean Luc Brunel': 'Jean-Luc Brunel',
+    'Mandelson': 'Peter Mandelson',
+    'Lord Mandelson': 'Peter Mandelson',
+    'Jagland': 'Thorbjørn Jagland',
+    'Thorbjorn Jagland': 'Thorbjørn Jagland',
+    'Bondi': 'Pam Bondi',
+    'Pamela Bondi': 'Pam Bondi',
+    'Acosta': 'Alexander Acosta',
+    'Alex Acosta': 'Alexander Acosta',
+    'Lutnick': 'Howard Lutnick',
+    'Ruemmler': 'Kathryn Ruemmler',
+}
+
+
+def slugify(name):
+    return name.lower().replace(' ', '-').replace('.', '').replace("'", '')
+
+
+def _trie_regex(words):
+    """Compile words into one alternation shaped like a trie (shared prefixes factored out)."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def emit(node):
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        if '' in node:
+            return '(?:' + '|'.join(branches) + ')?'
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    return re.compile(r'(?<!\w)(?:' + emit(trie) + r')(?!\w)')
+
+
+class NameTagger:
+    def __init__(self, names, aliases=ALIASES):
+        self.names = list(dict.fromkeys(names))
+        self.lookup = {name: name for name in self.names}
+        for alias, name in aliases.items():
+            if name in self.lookup and alias not in self.lookup:
+                self.lookup[alias] = name
+        self.pattern = _trie_regex(self.lookup) if self.lookup else None
+
+    def tag(self, text):
+        """Known people mentioned in text, in order of first mention."""
+        if not self.pattern or not text:
+            return []
+        return list(dict.fromkeys(self.lookup[m.group(0)] for m in self.pattern.finditer(text)))
+
+    def is_known(self, name):
+        return name in self.lookup
+
+    def agreement(self, data):
+        """Compare local tags of a roundup's bullets with the model's names list."""
+        text = '\n'.join(f"{b.get('name', '')}: {b.get('text', '')}" for b in data.get('bullets_long', []))
+        local = set(self.tag(text))
+        model = set(data.get('names', []))
+        model_known = {self.lookup.get(n, n) for n in model if self.is_known(n)}
+        agreed = local & model_known
+        return {
+            'tagged': len(local),
+            'model_names': len(model),
+            'precision': round(len(agreed) / len(local), 3) if local else None,
+            'recall_known': round(len(agreed) / len(model_known), 3) if model_known else None,
+            'unknown_names': sorted(n for n in model if not self.is_known(n)),
+        }
+
+
+def load_tagger(bios_path='name-bios.json', display_names=()):
+    """Build a tagger from the bio slugs, preferring the published spelling of each name."""
+    try:
+        with open(bios_path, 'r', encoding='utf-8') as f:
+            slugs = list(json.load(f))
+    except (OSError, ValueError):
+        slugs = []
+    spelled = {}
+    for name in display_names:
+        spelled.setdefault(slugify(name), name)
+    names = [spelled.get(slug) or ' '.join(w.capitalize() for w in slug.split('-')) for slug in slugs]
+    return NameTagger(names)
+
+
+def _cli_tagger(args):
+    try:
+        with open(args.index, 'r', encoding='utf-8') as f:
+            display_names = [n for entry in json.load(f) for n in entry.get('names', [])]
+    except (OSError, ValueError):
+        display_names = []
+    return load_tagger(args.bios, display_names)
+
+
+def cmd_tag(args):
+    tagger = _cli_tagger(args)
+    print(json.dumps(tagger.tag(args.text), ensure_ascii=False))
+
+
+def cmd_bench(args):
+    tagger = _cli_tagger(args)
+    rng = random.Random(0)
+    names = list(tagger.lookup)
+    filler = "Epstein files reveal new details as court unseals records in New York".split()
+    titles = []
+    for _ in range(args.items):
+        words = rng.sample(filler, 6)
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randint(0, len(words)), rng.choice(names))
+        titles.append(' '.join(words))
+    started = time.perf_counter()
+    tagged = sum(len(tagger.tag(t)) for t in titles)
+    elapsed = time.perf_counter() - started
+    print(f"{len(tagger.names)} names, {len(tagger.lookup)} patterns")
+    print(f"Tagged {args.items} headlines ({tagged} mentions) in {elapsed * 1000:.1f} ms, "
+          f"{elapsed / args.items * 1e6:.1f} µs per headline")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bios', default='name-bios.json')
+    parser.add_argument('--index', default='roundup-index.json', help='published spellings of names')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('tag', help='tag one piece of text')
+    p.add_argument('text')
+    p.set_defaults(func=cmd_tag)
+    p = sub.add_parser('bench', help='time tagging synthetic headlines')
+    p.add_argument('--items', type=int, default=10000)
+    p.set_defaults(func=cmd_bench)
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
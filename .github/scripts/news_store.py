@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+SQLite store of every news item the daily generator has ingested.
+
+Each run records the items it fetched, so the next run can tell which ones
+are new since the last successful roundup instead of re-processing
+everything Google News still returns. The same database answers historical
+questions offline, e.g.:
+
+    python .github/scripts/news_store.py search "Les Wexner" --days 30
+    python .github/scripts/news_store.py stats
+    python .github/scripts/news_store.py queries
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import time
+import urllib.parse
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    title_hash TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    canonical_url TEXT NOT NULL,
+    source TEXT,
+    date_text TEXT,
+    published REAL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    first_run INTEGER
+);
+CREATE INDEX IF NOT EXISTS items_canonical_url ON items (canonical_url);
+CREATE INDEX IF NOT EXISTS items_source ON items (source);
+CREATE INDEX IF NOT EXISTS items_published ON items (published);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    finished REAL,
+    status TEXT NOT NULL DEFAULT 'running'
+);
+CREATE TABLE IF NOT EXISTS query_stats (
+    run_id INTEGER NOT NULL,
+    query TEXT NOT NULL,
+    fetched INTEGER NOT NULL,
+    relevant INTEGER NOT NULL,
+    unique_relevant INTEGER NOT NULL,
+    PRIMARY KEY (run_id, query)
+);
+"""
+
+# Query parameters that only track the click, not the story
+TRACKING_PARAMS = ('utm_', 'oc', 'fbclid', 'gclid')
+
+
+def normalize_title(title):
+    title = re.sub(r'[^\w\s]', ' ', title.lower())
+    return ' '.join(title.split())
+
+
+def title_hash(title):
+    return hashlib.sha1(normalize_title(title).encode('utf-8')).hexdigest()
+
+
+def canonical_url(url):
+    parts = urllib.parse.urlsplit(url.strip())
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAMS)]
+    return urllib.parse.urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/') or '/',
+        urllib.parse.urlencode(query), '',
+    ))
+
+
+class NewsStore:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        self.run_id = None
+
+    def begin_run(self):
+        cur = self.db.execute("INSERT INTO runs (started) VALUES (?)", (time.time(),))
+        self.db.commit()
+        self.run_id = cur.lastrowid
+        return self.run_id
+
+    def finish_run(self, status='success'):
+        if self.run_id is None:
+            return
+        self.db.execute("UPDATE runs SET finished = ?, status = ? WHERE id = ?",
+                        (time.time(), status, self.run_id))
+        self.db.commit()
+
+    def last_success(self):
+        """Finish time of the most recent successful run, or None."""
+        row = self.db.execute(
+            "SELECT MAX(finished) FROM runs WHERE status = 'success'").fetchone()
+        return row[0]
+
+    def ingest(self, articles):
+        """Record fetched articles and return those first seen since the last successful run.
+
+        Items first seen by a failed run are still treated as new, so a crash
+        after fetching never hides stories from the next attempt.
+        """
+        since = self.last_success()
+        now = time.time()
+        new = []
+        with self.db:
+            for a in articles:
+                h = title_hash(a['title'])
+                self.db.execute(
+                    """INSERT INTO items (title_hash, title, url, canonical_url, source, date_text,
+                                          published, first_seen, last_seen, first_run)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (title_hash) DO UPDATE SET last_seen = excluded.last_seen""",
+                    (h, a['title'], a['url'], canonical_url(a['url']), a['source'], a['date'],
+                     a.get('published'), now, now, self.run_id))
+                first_seen = self.db.execute(
+                    "SELECT first_seen FROM items WHERE title_hash = ?", (h,)).fetchone()[0]
+                if since is None or first_seen > since:
+                    new.append(a)
+        return new
+
+    def record_query_stats(self, stats):
+        """Save {query: (fetched, relevant, unique_relevant)} for the current run."""
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO query_stats VALUES (?, ?, ?, ?, ?)",
+                [(self.run_id, q, *counts) for q, counts in stats.items()])
+
+    def query_history(self, samples=14):
+        """Per-query yield history for the planner.
+
+        Returns {query: {'yields': [unique counts, newest first],
+        'runs_since': runs since the query last ran}}.
+        """
+        history = {}
+        rows = self.db.execute(
+            "SELECT query, run_id, unique_relevant FROM query_stats ORDER BY run_id DESC").fetchall()
+        for query, run_id, unique in rows:
+            entry = history.setdefault(query, {'yields': [], 'last_run': run_id})
+            if len(entry['yields']) < samples:
+                entry['yields'].append(unique)
+        for entry in history.values():
+            entry['runs_since'] = self.db.execute(
+                "SELECT COUNT(*) FROM runs WHERE id > ? AND id IS NOT ?",
+                (entry.pop('last_run'), self.run_id)).fetchone()[0]
+        return history
+
+    def search(self, term, days=30):
+        """Items whose title mentions term, published (or first seen) in the last N days."""
+        since = time.time() - days * 86400
+        return self.db.execute(
+            """SELECT title, url, source, date_text, published, first_seen FROM items
+               WHERE COALESCE(published, first_seen) >= ? AND title LIKE ?
+               ORDER BY COALESCE(published, first_seen) DESC""",
+            (since, f"%{term}%")).fetchall()
+
+    def stats(self):
+        items = self.db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        runs = self.db.execute(
+            "SELECT status, COUNT(*) FROM runs GROUP BY status ORDER BY status").fetchall()
+        sources = self.db.execute(
+            "SELECT source, COUNT(*) AS n FROM items GROUP BY source ORDER BY n DESC LIMIT 10").fetchall()
+        return items, runs, sources
+
+    def close(self):
+        self.db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the ingested news item store.")
+    parser.add_argument('--db', default=os.environ.get('NEWS_STORE_PATH', '.cache/news.db'))
+    sub = parser.add_subparsers(dest='command', required=True)
+    search = sub.add_parser('search', help='items mentioning a name or phrase')
+    search.add_argument('term')
+    search.add_argument('--days', type=int, default=30)
+    sub.add_parser('stats', help='item, run and source counts')
+    sub.add_parser('queries', help='per-query yield over recent runs')
+    args = parser.parse_args()
+
+    store = NewsStore(args.db)
+    if args.command == 'search':
+        rows = store.search(args.term, args.days)
+        for row in rows:
+            when = time.strftime('%Y-%m-%d', time.gmtime(row['published'] or row['first_seen']))
+            print(f"{when}  {row['source']}: {row['title']}\n            {row['url']}")
+        print(f"{len(rows)} items mentioning '{args.term}' in the last {args.days} days")
+    elif args.command == 'queries':
+        for query, entry in sorted(store.query_history().items()):
+            yields = entry['yields']
+            print(f"{sum(yields) / len(yields):6.1f} unique/run  last run {entry['runs_since']} runs ago  {query}")
+    else:
+        items, runs, sources = store.stats()
+        print(f"{items} items")
+        for status, n in runs:
+            print(f"  {n} {status} runs")
+        for source, n in sources:
+            print(f"  {n:5d}  {source}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
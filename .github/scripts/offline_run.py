@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Run the whole daily pipeline offline and print per-stage timings.
+
+The site is copied into a temporary directory, feeds come from the
+rss_replay stand-in and Claude is replaced by the fake (or replay)
+backend, so nothing in the working tree changes and no network or API
+key is needed:
+
+    python .github/scripts/offline_run.py [--items 100] [--backend fake] [--runs 3] [--keep]
+
+Each run deletes the day's page so the next run regenerates it; caches in
+the copy's .cache are kept, so runs after the first are warm.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(SCRIPTS_DIR, '..', '..'))
+
+
+def copy_site(dest):
+    """Copy the tracked files of the repository into dest."""
+    try:
+        files = subprocess.run(['git', 'ls-files', '-z'], cwd=REPO_ROOT, check=True,
+                               capture_output=True).stdout.decode('utf-8').split('\0')
+    except (OSError, subprocess.CalledProcessError):
+        shutil.copytree(REPO_ROOT, dest, dirs_exist_ok=True, ignore=shutil.ignore_patterns('.git', '.cache'))
+        return
+    for name in filter(None, files):
+        target = os.path.join(dest, name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copy2(os.path.join(REPO_ROOT, name), target)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100, help='items per synthetic feed')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every feed response')
+    parser.add_argument('--backend', default='fake', choices=['fake', 'replay'])
+    parser.add_argument('--llm-latency', type=float, default=0.0, help='seconds per fake LLM call')
+    parser.add_argument('--runs', type=int, default=1)
+    parser.add_argument('--keep', action='store_true', help='keep the temporary site copy')
+    parser.add_argument('--checkpoints', action='store_true',
+                        help='keep stage checkpoints between runs (later runs resume instead of regenerating)')
+    args = parser.parse_args()
+
+    sys.path.insert(0, SCRIPTS_DIR)
+    from rss_replay import start_server
+
+    workdir = tempfile.mkdtemp(prefix='offline-run-')
+    copy_site(workdir)
+    server, base_url = start_server(items=args.items, latency=args.latency)
+    os.environ.update({
+        'RSS_BASE_URL': base_url,
+        'LLM_BACKEND': args.backend,
+        'LLM_FAKE_LATENCY': str(args.llm_latency),
+        'LLM_FIXTURES_DIR': os.path.join(REPO_ROOT, '.github', 'fixtures', 'llm'),
+        'CHECKPOINTS': '1' if args.checkpoints else '0',
+    })
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import generate_article
+        for run in range(1, args.runs + 1):
+            started = time.perf_counter()
+            generate_article.main()
+            elapsed = time.perf_counter() - started
+            with open(generate_article.RUN_REPORT_PATH, encoding='utf-8') as f:
+                report = json.load(f)
+            print(f"\nRun {run}: {report['status']} in {elapsed:.2f}s")
+            print(f"{'stage':<14} {'wall s':>8} {'cpu s':>8} {'items':>6}")
+            for stage in report['stages']:
+                print(f"{stage['stage']:<14} {stage['wall_s']:>8.3f} {stage['cpu_s']:>8.3f} {stage.get('items', ''):>6}")
+            page = f"{report['slug']}.html"
+            if os.path.exists(page):
+                os.remove(page)
+    finally:
+        os.chdir(cwd)
+        server.shutdown()
+        server.server_close()
+        if args.keep:
+            print(f"\nSite copy kept in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
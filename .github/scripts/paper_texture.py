@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Aged-paper background for thumbnails: noise, darkened edges and a vignette.
+
+The effect used to be two Python loops over every pixel, about 800k
+interpreted pixel operations for an 840x472 thumbnail. With numpy
+installed it is computed as whole-array operations instead. Without
+numpy, the original loops are still used. Given the same noise, both
+paths produce exactly the same pixels, and the benchmark checks that:
+
+    python .github/scripts/paper_texture.py bench [--sizes 840x472,1920x1080]
+"""
+
+import argparse
+import random
+import time
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NOISE = 8            # each pixel brightens or darkens by up to this much
+EDGE_DARKEN = 15     # extra darkening at the very edge, fading out over 120px
+CHANNEL_SHIFT = (0, 3, 8)  # yellows the paper: green and blue are pulled down more
+VIGNETTE = 0.15      # corners end up 15% darker than the centre
+
+
+def _texture_loops(img, noise):
+    pixels = img.load()
+    width, height = img.size
+
+    # Add paper texture - noise
+    for y in range(height):
+        for x in range(width):
+            r, g, b = pixels[x, y]
+            n = noise(x, y)
+            edge_dist = min(x, width - x, y, height - y)
+            edge_darken = max(0, EDGE_DARKEN - edge_dist // 8)
+            r = max(0, min(255, r + n - edge_darken - CHANNEL_SHIFT[0]))
+            g = max(0, min(255, g + n - edge_darken - CHANNEL_SHIFT[1]))
+            b = max(0, min(255, b + n - edge_darken - CHANNEL_SHIFT[2]))
+            pixels[x, y] = (r, g, b)
+
+    # Add vignette
+    cx, cy = width // 2, height // 2
+    max_dist = (cx ** 2 + cy ** 2) ** 0.5
+    for y in range(height):
+        for x in range(width):
+            r, g, b = pixels[x, y]
+            dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
+            vignette = 1 - (dist / max_dist) * VIGNETTE
+            pixels[x, y] = (int(r * vignette), int(g * vignette), int(b * vignette))
+    return img
+
+
+def _texture_arrays(img, noise):
+    width, height = img.size
+    x = np.arange(width)
+    y = np.arange(height)[:, None]
+
+    edge_dist = np.minimum(np.minimum(x, width - x), np.minimum(y, height - y))
+    edge_darken = np.maximum(0, EDGE_DARKEN - edge_dist // 8)
+    shade = (noise - edge_darken)[:, :, None] - np.array(CHANNEL_SHIFT)
+    pixels = np.clip(np.asarray(img, dtype=np.int32) + shade, 0, 255)
+
+    # np.power rather than np.sqrt so the result matches the loops' ** 0.5 exactly
+    cx, cy = width // 2, height // 2
+    dist = np.power(((x - cx) ** 2 + (y - cy) ** 2).astype(np.float64), 0.5)
+    vignette = 1 - (dist / (cx ** 2 + cy ** 2) ** 0.5) * VIGNETTE
+    return Image.fromarray((pixels * vignette[:, :, None]).astype(np.uint8), 'RGB')
+
+
+def paper_texture(img, rng=random):
+    """Return img (RGB) with paper noise, darkened edges and a vignette applied."""
+    width, height = img.size
+    if np is None:
+        return _texture_loops(img, lambda x, y: rng.randint(-NOISE, NOISE))
+    noise = np.random.default_rng(rng.getrandbits(64)).integers(-NOISE, NOISE + 1, size=(height, width))
+    return _texture_arrays(img, noise)
+
+
+def cmd_bench(args):
+    if np is None:
+        raise SystemExit("numpy is not installed; only the loop implementation is available")
+    print(f"{'size':>10} {'loops s':>8} {'arrays s':>9} {'speedup':>8}  identical")
+    for size in args.sizes.split(','):
+        width, height = (int(v) for v in size.split('x'))
+        noise = np.random.default_rng(args.seed).integers(-NOISE, NOISE + 1, size=(height, width))
+        noise_rows = noise.tolist()
+        base = Image.new('RGB', (width, height), '#f4ead5')
+
+        loops = arrays = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            expected = _texture_loops(base.copy(), lambda x, y: noise_rows[y][x])
+            loops = min(loops, time.perf_counter() - started)
+            started = time.perf_counter()
+            actual = _texture_arrays(base, noise)
+            arrays = min(arrays, time.perf_counter() - started)
+        identical = expected.tobytes() == actual.tobytes()
+        print(f"{size:>10} {loops:>8.3f} {arrays:>9.4f} {loops / arrays:>7.0f}x  {'yes' if identical else 'NO'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('bench', help='time the loops against the array version and compare their pixels')
+    p.add_argument('--sizes', default='840x472,1920x1080')
+    p.add_argument('--repeat', type=int, default=3)
+    p.add_argument('--seed', type=int, default=0)
+    p.set_defaults(func=cmd_bench)
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
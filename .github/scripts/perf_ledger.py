@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Append-only history of run reports, with trend and regression checks.
+
+Each pipeline run appends one JSON line: its status, the archive size at
+the time (daily-*.html pages and names/*.html tag pages) and the wall/CPU
+time and peak RSS of every stage it actually ran. Stages such as name-page regeneration
+get slower as the archive grows, so the ledger is the place to see it.
+
+    python .github/scripts/perf_ledger.py trend [--stage name_pages] [--last 60]
+    python .github/scripts/perf_ledger.py check [--percentile 95] [--window 30]
+
+trend prints per-stage medians and a least-squares fit of stage time
+against archive size. check compares each run's stage times with the
+percentile band of the runs before it (after removing the growth
+explained by archive size) and exits 1 if the newest run is above it.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+DEFAULT_LEDGER = os.environ.get('PERF_LEDGER_PATH', '.github/perf/ledger.jsonl')
+MIN_RUNS = 5  # history needed before a stage time can be flagged
+
+
+def archive_size(root='.'):
+    return {
+        'articles': len(glob.glob(os.path.join(root, 'daily-*.html'))),
+        'tags': len(glob.glob(os.path.join(root, 'names', '*.html'))),
+    }
+
+
+def append_run(path, report, archive):
+    """Append one run (a RunReport.as_dict()) to the ledger.
+
+    Stages reused from a checkpoint took no real time, so they are left out
+    rather than pulling down the bands check compares against.
+    """
+    entry = {
+        'date': report.get('date'),
+        'started': report.get('started'),
+        'status': report.get('status'),
+        'total_wall_s': report.get('total_wall_s'),
+        'archive': archive,
+        'stages': {
+            s['stage']: {k: s[k] for k in ('status', 'wall_s', 'cpu_s', 'peak_rss_mb', 'items') if k in s}
+            for s in report.get('stages', []) if not s.get('resumed')
+        },
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, sort_keys=True) + '\n')
+    print(f"Appended run to performance ledger {path}")
+
+
+def load(path):
+    entries = []
+    if not os.path.exists(path):
+        return entries
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # a truncated last line from a killed run
+    return entries
+
+
+def percentile(values, p):
+    """Linear-interpolated percentile (p in 0..100) of a non-empty list."""
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def linear_fit(xs, ys):
+    """Least-squares y = slope * x + intercept; returns (slope, intercept, r2) or None."""
+    n = len(xs)
+    if n < 2:
+        return None
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    ss_res = sum((y - slope * x - intercept) ** 2 for x, y in zip(xs, ys))
+    r2 = 1 - ss_res / ss_tot if ss_tot else 1.0
+    return slope, intercept, r2
+
+
+def stage_series(entries, metric='wall_s'):
+    """Return {stage: [(entry_index, value, entry)]} for stages that completed."""
+    series = {}
+    for i, entry in enumerate(entries):
+        for name, stage in entry.get('stages', {}).items():
+            if stage.get('status', 'ok') == 'ok' and metric in stage:
+                series.setdefault(name, []).append((i, stage[metric], entry))
+    return series
+
+
+def find_regressions(entries, percentile_p=95, window=30, margin=0.2, metric='wall_s', by_size=True):
+    """Flag stage values outside the [100-p, p] percentile band of the preceding window.
+
+    With by_size, values are first detrended against a fit of the window
+    on archive size, so steady growth with the archive is not flagged but
+    a jump beyond it is. margin widens the band by that fraction of the
+    expected value to absorb ordinary run-to-run noise.
+
+    Returns a list of (entry_index, stage, value, expected, 'slow'|'fast').
+    """
+    flagged = []
+    for name, points in stage_series(entries, metric).items():
+        for j, (i, value, entry) in enumerate(points):
+            history = points[max(0, j - window):j]
+            if len(history) < MIN_RUNS:
+                continue
+            values = [v for _, v, _ in history]
+            fit = None
+            if by_size:
+                sizes = [e.get('archive', {}).get('articles', 0) for _, _, e in history]
+                fit = linear_fit(sizes, values)
+
+            def expected_at(e):
+                if fit is None:
+                    return percentile(values, 50)
+                return fit[0] * e.get('archive', {}).get('articles', 0) + fit[1]
+
+            residuals = [v - expected_at(e) for _, v, e in history]
+            expected = expected_at(entry)
+            slack = margin * abs(expected)
+            residual = value - expected
+            if residual > percentile(residuals, percentile_p) + slack:
+                flagged.append((i, name, value, expected, 'slow'))
+            elif residual < percentile(residuals, 100 - percentile_p) - slack:
+                flagged.append((i, name, value, expected, 'fast'))
+    return sorted(flagged)
+
+
+def cmd_trend(args):
+    entries = load(args.ledger)[-args.last:] if args.last else load(args.ledger)
+    if not entries:
+        print(f"No runs in {args.ledger}")
+        return 0
+    print(f"{len(entries)} runs from {entries[0].get('date')} to {entries[-1].get('date')}")
+    print(f"{'stage':<14} {'runs':>5} {'median':>8} {'p90':>8} {'latest':>8} "
+          f"{'s/100 articles':>15} {'r2':>5} {'s/100 tags':>11} {'r2':>5}")
+    for name, points in stage_series(entries, args.metric).items():
+        if args.stage and name != args.stage:
+            continue
+        values = [v for _, v, _ in points]
+        row = f"{name:<14} {len(values):>5} {percentile(values, 50):>8.2f} {percentile(values, 90):>8.2f} {values[-1]:>8.2f}"
+        for key in ('articles', 'tags'):
+            xs = [e.get('archive', {}).get(key, 0) for _, _, e in points]
+            fit = linear_fit(xs, values)
+            if fit:
+                row += f" {fit[0] * 100:>{15 if key == 'articles' else 11}.3f} {fit[2]:>5.2f}"
+            else:
+                row += f" {'-':>{15 if key == 'articles' else 11}} {'-':>5}"
+        print(row)
+    return 0
+
+
+def cmd_check(args):
+    entries = load(args.ledger)
+    flagged = find_regressions(entries, args.percentile, args.window, args.margin, args.metric,
+                               by_size=not args.raw)
+    if not flagged:
+        print(f"No stage outside the p{100 - args.percentile:g}-p{args.percentile:g} band in {len(entries)} runs")
+        return 0
+    for i, name, value, expected, direction in flagged:
+        print(f"{entries[i].get('date')} {name}: {value:.2f} {args.metric} is {direction} "
+              f"(expected ~{expected:.2f} from the previous {args.window} runs)")
+    latest_slow = [f for f in flagged if f[0] == len(entries) - 1 and f[4] == 'slow']
+    return 1 if latest_slow else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ledger', default=DEFAULT_LEDGER)
+    parser.add_argument('--metric', default='wall_s', choices=['wall_s', 'cpu_s', 'peak_rss_mb'])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    trend = sub.add_parser('trend', help='per-stage medians and growth against archive size')
+    trend.add_argument('--stage')
+    trend.add_argument('--last', type=int, default=0, help='only the most recent N runs')
+    trend.set_defaults(func=cmd_trend)
+
+    check = sub.add_parser('check', help='flag stage times outside the historical percentile band')
+    check.add_argument('--percentile', type=float, default=95)
+    check.add_argument('--window', type=int, default=30, help='previous runs the band is built from')
+    check.add_argument('--margin', type=float, default=0.2, help='extra band width as a fraction of the expected value')
+    check.add_argument('--raw', action='store_true', help='compare raw times without the archive-size fit')
+    check.set_defaults(func=cmd_check)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Assemble a prompt from named sections under a token budget.
+
+Fixed sections (instructions, output format) are always kept whole. List
+sections (fetched articles, recent headlines) hold one line per item and
+can be trimmed from the end when the prompt is over budget, so their items
+should be ordered most important first. Sections are trimmed in order of
+their trim_order (lowest first) and never below their min_items. Tokens
+sent alongside the prompt, such as a cached system prompt, can be passed
+as reserved so they count toward the budget.
+
+    builder = PromptBuilder(budget=8000, count=estimate_tokens)
+    builder.text('intro', "You are formatting ...")
+    builder.items('history', recent_lines, header="RECENT ROUNDUPS:", trim_order=0)
+    builder.items('articles', article_lines, header="ARTICLES:", trim_order=1, min_items=8)
+    prompt = builder.build()
+"""
+
+
+class _Section:
+    def __init__(self, name, header, items, footer, trim_order, min_items):
+        self.name = name
+        self.header = header
+        self.items = list(items)
+        self.footer = footer
+        self.trim_order = trim_order
+        self.min_items = min_items
+        self.dropped = 0
+
+    def render(self):
+        if not self.items and self.trim_order is not None and self.header:
+            return ''  # an emptied list section drops its header too
+        parts = [self.header] if self.header else []
+        parts.extend(self.items)
+        if self.footer:
+            parts.append(self.footer)
+        return '\n'.join(parts)
+
+
+class PromptBuilder:
+    def __init__(self, budget, count, reserved=None):
+        self.budget = budget  # 0 disables trimming
+        self.count = count
+        self.reserved = dict(reserved or {})  # tokens sent outside this prompt, e.g. a system prompt
+        self.sections = []
+
+    def text(self, name, text):
+        """Add a section that is always kept whole."""
+        self.sections.append(_Section(name, '', [text], '', None, 0))
+
+    def items(self, name, lines, header='', footer='', trim_order=0, min_items=0):
+        """Add a list section whose trailing lines can be dropped to fit the budget."""
+        self.sections.append(_Section(name, header, lines, footer, trim_order, min_items))
+
+    def section_tokens(self):
+        tokens = dict(self.reserved)
+        tokens.update((s.name, self.count(s.render())) for s in self.sections)
+        return tokens
+
+    def _render(self):
+        return '\n'.join(s.render() for s in self.sections)
+
+    def build(self):
+        """Return the prompt, trimming list sections if it is over budget."""
+        before = self.section_tokens()
+        reserved = sum(self.reserved.values())
+        total = reserved + self.count(self._render())
+        if self.budget:
+            trimmable = sorted((s for s in self.sections if s.trim_order is not None),
+                               key=lambda s: s.trim_order)
+            for section in trimmable:
+                while total > self.budget and len(section.items) > section.min_items:
+                    section.items.pop()
+                    section.dropped += 1
+                    total = reserved + self.count(self._render())
+        after = self.section_tokens()
+
+        breakdown = ', '.join(f"{name} {tokens}" for name, tokens in before.items())
+        print(f"Prompt tokens before budget: ~{sum(before.values())} ({breakdown})")
+        dropped = ', '.join(f"{s.dropped} {s.name}" for s in self.sections if s.dropped)
+        print(f"Prompt tokens after budget: ~{sum(after.values())} of {self.budget or 'unlimited'}"
+              + (f" (dropped {dropped})" if dropped else ''))
+        if self.budget and total > self.budget:
+            print("WARNING: prompt is still over budget after trimming to the minimum")
+        return self._render()
@@ -0,0 +1,73 @@
+"""
+Pick which Google News queries to run today from their past yield.
+
+A query's yield is the number of relevant items it returned that no other
+query returned in the same run. Queries that keep adding nothing new are
+skipped once the per-run request budget is reached, but each one is still
+re-run every few runs (exploration) so a query that starts finding new
+stories is noticed.
+
+Queries with too little history always run until their yield is known,
+on top of the budget, which only limits queries whose yield is known.
+"""
+
+MIN_SAMPLES = 3  # runs of history before a query can be skipped
+EXPLORE_AFTER_RUNS = 5  # re-run a skipped query after this many runs
+EXPLORE_SLOTS = 2  # budget reserved for re-running skipped queries
+
+
+def unique_yield(queries, per_query, is_relevant):
+    """Return {query: (fetched, relevant, unique_relevant)} for one run.
+
+    per_query lists the articles each query returned, in the same order
+    as queries; an item counts as unique if only one query returned it.
+    Queries that failed (None) are left out so an outage is not mistaken
+    for a low yield.
+    """
+    seen_by = {}
+    for i, articles in enumerate(per_query):
+        for a in articles or []:
+            seen_by.setdefault(a['title'].lower(), set()).add(i)
+
+    stats = {}
+    for i, (query, articles) in enumerate(zip(queries, per_query)):
+        if articles is None:
+            continue
+        relevant = [a for a in articles if is_relevant(a)]
+        unique = sum(1 for a in relevant if seen_by[a['title'].lower()] == {i})
+        stats[query] = (len(articles), len(relevant), unique)
+    return stats
+
+
+def plan_queries(queries, history, budget):
+    """Choose queries to run, returned in their original order.
+
+    Every query with fewer than MIN_SAMPLES runs of history is chosen, plus
+    up to budget of the others.
+
+    history maps query -> {'yields': [unique counts, newest first],
+    'runs_since': runs since the query last ran (None if never)}.
+    """
+    if budget <= 0 or budget >= len(queries):
+        return list(queries)
+
+    def info(q):
+        return history.get(q, {'yields': [], 'runs_since': None})
+
+    learning = [q for q in queries if len(info(q)['yields']) < MIN_SAMPLES]
+    stale = sorted((q for q in queries if q not in learning
+                    and (info(q)['runs_since'] or 0) >= EXPLORE_AFTER_RUNS),
+                   key=lambda q: -info(q)['runs_since'])
+    ranked = sorted((q for q in queries if q not in learning),
+                    key=lambda q: -sum(info(q)['yields']) / len(info(q)['yields']))
+
+    established = []
+    for q in stale[:EXPLORE_SLOTS] + ranked:
+        if q not in established:
+            established.append(q)
+    chosen = set(learning) | set(established[:budget])
+
+    skipped = [q for q in queries if q not in chosen]
+    if skipped:
+        print(f"Query planner: running {len(chosen)}/{len(queries)} queries, skipping {', '.join(skipped)}")
+    return [q for q in queries if q in chosen]
@@ -0,0 +1,90 @@
+"""
+Relevance scoring for fetched RSS articles.
+
+Every keyword and known name is compiled into a single regex alternation,
+so each headline is scanned once no matter how many terms there are. An
+article is relevant only if it hits at least one keyword; its score then
+adds up:
+
+- keyword weights (each distinct keyword counted once)
+- known names from name-bios.json
+- recency, decaying linearly to zero over the fetch window
+- coverage, i.e. how many distinct outlets ran the story (after clustering)
+
+The top k are picked with a heap instead of truncating in fetch order.
+"""
+
+import heapq
+import math
+import re
+import time
+
+# Broad keywords to capture diverse stories; weights favour the specific ones
+KEYWORDS = {
+    'epstein': 1.0,
+    'ghislaine': 2.0,
+    'maxwell': 1.5,
+    'prince andrew': 2.0,
+    'wexner': 2.0,
+    'brunel': 2.0,
+    'trafficking': 1.5,
+    'victim': 1.5,
+    'survivor': 1.5,
+    'unsealed': 1.0,
+    'flight log': 2.0,
+    'little st james': 2.0,
+    'pedophile island': 2.0,
+}
+
+NAME_WEIGHT = 2.5
+RECENCY_WEIGHT = 2.0
+RECENCY_WINDOW_HOURS = 48
+COVERAGE_WEIGHT = 1.0
+
+
+def _term_pattern(term):
+    # "jean luc brunel" should also match "Jean-Luc Brunel"
+    return r'[\s\-]+'.join(re.escape(word) for word in term.split())
+
+
+class RelevanceScorer:
+    def __init__(self, keywords=None, names=()):
+        self.keywords = dict(KEYWORDS if keywords is None else keywords)
+        self.names = {' '.join(n.lower().replace('-', ' ').split()) for n in names}
+        self.names -= set(self.keywords)
+        terms = sorted(set(self.keywords) | self.names, key=len, reverse=True)
+        self.pattern = re.compile(r'\b(?:' + '|'.join(_term_pattern(t) for t in terms) + r')',
+                                  re.IGNORECASE)
+        # A name match such as "jeffrey epstein" swallows the keywords inside it
+        self.name_keywords = {n: {k for k in self.keywords if re.search(r'\b' + _term_pattern(k), n)}
+                              for n in self.names}
+
+    def score(self, article, now=None):
+        """Return the article's score, or 0.0 if it matches no keyword."""
+        hits = {' '.join(m.group(0).lower().replace('-', ' ').split())
+                for m in self.pattern.finditer(article['title'])}
+        names = {h for h in hits if h in self.names}
+        keywords = (hits - names).union(*(self.name_keywords[n] for n in names))
+        if not keywords:
+            return 0.0
+
+        score = sum(self.keywords[k] for k in keywords) + NAME_WEIGHT * len(names)
+
+        if article.get('published'):
+            age_hours = ((now or time.time()) - article['published']) / 3600
+            score += RECENCY_WEIGHT * max(0.0, 1 - age_hours / RECENCY_WINDOW_HOURS)
+
+        outlets = {article['source']} | {alt['source'] for alt in article.get('alternates', [])}
+        score += COVERAGE_WEIGHT * math.log1p(len(outlets) - 1)
+        return score
+
+    def filter(self, articles):
+        """Relevant articles only, in their original order."""
+        return [a for a in articles if self.score(a)]
+
+    def top_k(self, articles, k, now=None):
+        """The k highest-scoring relevant articles, best first (ties keep input order)."""
+        now = now or time.time()
+        scored = ((self.score(a, now), -i, a) for i, a in enumerate(articles))
+        best = heapq.nlargest(k, (entry for entry in scored if entry[0]), key=lambda e: (e[0], e[1]))
+        return [a for _, _, a in best]
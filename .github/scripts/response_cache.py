@@ -0,0 +1,68 @@
+"""
+On-disk cache of Claude responses keyed by the exact request.
+
+The key is a SHA-256 of the request parameters (model, max_tokens,
+messages and anything else passed to messages.create) serialized as
+canonical JSON, so a rerun with byte-for-byte the same prompt reuses the
+stored response text instead of paying for another API call, while any
+change to the articles, prompt or parameters is a miss. fileutil.evict()
+applies the TTL and size cap, as it does for the RSS cache.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from fileutil import evict, write_atomic
+
+
+class ResponseCache:
+    def __init__(self, cache_dir, ttl_seconds, max_bytes, read=True):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.read = read  # False stores fresh responses without serving cached ones
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(request):
+        canonical = json.dumps(request, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def get(self, key):
+        """Return the cached response text for key, or None on a miss."""
+        entry = None
+        if self.read:
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+            if entry and time.time() - entry.get('stored_at', 0) > self.ttl_seconds:
+                entry = None
+        with self.lock:
+            if entry:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry['text'] if entry else None
+
+    def put(self, key, text, model=None):
+        write_atomic(self._path(key), json.dumps({'model': model, 'stored_at': time.time(), 'text': text}))
+
+    def evict(self):
+        """Drop expired entries, then the oldest ones until under max_bytes."""
+        evict(self.cache_dir, self.ttl_seconds, self.max_bytes)
+
+    def report(self):
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        print(f"LLM cache: {self.hits}/{total} hits ({rate:.0f}% hit rate)")
@@ -0,0 +1,79 @@
+"""
+Compact index of published roundups for the generation prompt.
+
+Each entry keeps the slug, date, headline, lead name and tags of one
+roundup. The prompt gets a rolling summary built from the most recent
+entries (headlines, plus how often each name led lately) rather than the
+full list of daily-*.html filenames, which grew by one line every day.
+
+The index lives in roundup-index.json. If it is missing, it is rebuilt
+once from the daily-*.html pages already on disk.
+"""
+
+import json
+import os
+import re
+from collections import Counter
+
+from fileutil import write_atomic
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def entry_from_html(filename, content):
+    """Build an index entry from a published roundup page."""
+    title_match = re.search(r'<h1[^>]*>([^<]+)</h1>', content)
+    headline = title_match.group(1).strip() if title_match else ''
+    headline = re.sub(r'^[A-Z][a-z]+ \d{1,2}:\s*', '', headline)  # drop the "February 20: " prefix
+    date_match = re.search(r'<time datetime="([^"]+)"', content)
+    tags = re.findall(r'class="article-tag">([^<]+)</a>', content)
+    return {
+        'slug': filename[:-len('.html')],
+        'date': date_match.group(1) if date_match else '',
+        'headline': headline,
+        'lead': tags[0] if tags else '',
+        'names': tags,
+    }
+
+
+class RoundupIndex:
+    def __init__(self, path, root='.'):
+        self.path = path
+        self.root = root
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+        entries = []
+        for filename in os.listdir(self.root):
+            if filename.startswith('daily-') and filename.endswith('.html'):
+                entries.append(entry_from_html(filename, _read(os.path.join(self.root, filename))))
+        entries.sort(key=lambda e: e['date'])
+        if entries:
+            print(f"Built roundup index from {len(entries)} published pages")
+        return entries
+
+    def add(self, slug, date, headline, lead, names):
+        self.entries = [e for e in self.entries if e['slug'] != slug]
+        self.entries.append({'slug': slug, 'date': date, 'headline': headline, 'lead': lead, 'names': list(names)})
+        self.entries.sort(key=lambda e: e['date'])
+
+    def save(self):
+        write_atomic(self.path, json.dumps(self.entries, indent=1, ensure_ascii=False))
+
+    def recent_lines(self, limit):
+        """One line per recent roundup, newest first."""
+        return [f"- {e['date']}: {e['headline']} (lead: {e['lead'] or 'n/a'})"
+                for e in reversed(self.entries[-limit:])]
+
+    def lead_counts(self, window):
+        """Most frequent lead names over the last window roundups."""
+        counts = Counter(e['lead'] for e in self.entries[-window:] if e['lead'])
+        return ', '.join(f"{name} ({n})" for name, n in counts.most_common(8))
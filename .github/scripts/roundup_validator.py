@@ -0,0 +1,140 @@
+"""
+Local checks on a generated roundup before it is published.
+
+Claude is told to use only the fetched articles, only recent ones, at
+least three different people, and a different lead than yesterday, but
+nothing verified any of it. validate_roundup() checks each bullet's URL
+against a hash index of the fetched articles (alternate sources included)
+and its publish date against the freshness window, then checks the
+roundup-wide rules. Problems come back as (path, reason) pairs such as
+('bullets_long[3]', ...) so only the offending parts need regenerating.
+"""
+
+from news_store import canonical_url
+
+MIN_BULLETS = 4
+MAX_BULLETS = 6
+MIN_PEOPLE = 3
+BULLET_LISTS = ('bullets_short', 'bullets_long')
+
+
+class ArticleIndex:
+    """Fetched articles keyed by canonical URL, including clustered alternates."""
+
+    def __init__(self, articles):
+        self.by_url = {}
+        for article in articles:
+            for url in [article['url']] + [alt['url'] for alt in article.get('alternates', [])]:
+                self.by_url.setdefault(self._key(url), article)
+
+    @staticmethod
+    def _key(url):
+        try:
+            return canonical_url(url)
+        except ValueError:
+            return url
+
+    def get(self, url):
+        return self.by_url.get(self._key(url))
+
+
+def _same_person(a, b):
+    return bool(a) and bool(b) and a.strip().lower() == b.strip().lower()
+
+
+def yesterday_lead(yesterday):
+    """The person yesterday's roundup led with, from latest_article.json."""
+    return yesterday.get('featured_name') or (yesterday.get('names') or [''])[0]
+
+
+def move_lead_bullet(data, lead):
+    """Swap the first story with the first one about someone other than lead.
+
+    Returns True if the order changed. Both bullet lists move together.
+    """
+    full = data['bullets_long']
+    if not full or not _same_person(full[0].get('name'), lead):
+        return False
+    for i, bullet in enumerate(full[1:], start=1):
+        if not _same_person(bullet.get('name'), lead):
+            for key in BULLET_LISTS:
+                bullets = data[key]
+                if i < len(bullets):
+                    bullets[0], bullets[i] = bullets[i], bullets[0]
+            return True
+    return False
+
+
+def validate_roundup(data, index, cutoff, lead):
+    """Return (path, reason) for every part of the roundup that breaks a rule.
+
+    cutoff is the oldest acceptable publish time (epoch seconds); lead is
+    yesterday's lead name, which today's headline and first bullet must avoid.
+    """
+    problems = []
+    bad = {}
+    for key in BULLET_LISTS:
+        for i, bullet in enumerate(data[key]):
+            article = index.get(bullet['url'])
+            if article is None:
+                bad[(key, i)] = "url is not one of the fetched articles"
+            elif article.get('published') and article['published'] < cutoff:
+                bad[(key, i)] = "source article is older than the freshness window"
+    # A story is replaced as a pair so the short and long bullets stay in step
+    for key, i in list(bad):
+        other = 'bullets_long' if key == 'bullets_short' else 'bullets_short'
+        if i < len(data[other]) and (other, i) not in bad:
+            bad[(other, i)] = f"replace together with {key}[{i}]"
+    problems.extend((f"{key}[{i}]", reason) for (key, i), reason in sorted(bad.items()))
+
+    count = len(data['bullets_long'])
+    for i in range(count, MIN_BULLETS):
+        for key in BULLET_LISTS:
+            problems.append((f"{key}[{i}]", f"missing: a roundup needs at least {MIN_BULLETS} stories"))
+
+    seen = []
+    repeats = []
+    for i, bullet in enumerate(data['bullets_long']):
+        name = (bullet.get('name') or '').strip().lower()
+        if name in seen:
+            repeats.append((i, bullet.get('name')))
+        else:
+            seen.append(name)
+    missing_people = MIN_PEOPLE - len(seen)
+    for i, name in reversed(repeats[-missing_people:] if missing_people > 0 else []):
+        if ('bullets_long', i) in bad:
+            continue
+        for key in BULLET_LISTS:
+            problems.append((f"{key}[{i}]", f"repeats {name}; the roundup needs at least {MIN_PEOPLE} different people"))
+
+    if lead:
+        headline = data.get('theme_headline', '')
+        if _same_person(data.get('featured_name'), lead) or lead.lower() in headline.lower():
+            problems.append(('theme_headline', f"features {lead}, who led yesterday; lead with someone else"))
+            problems.append(('featured_name', f"is {lead}, who led yesterday; use the new headline's person"))
+        if data['bullets_long'] and _same_person(data['bullets_long'][0].get('name'), lead):
+            for key in BULLET_LISTS:
+                problems.append((f"{key}[0]", f"is about {lead}, who led yesterday; the first story must be about someone else"))
+
+    merged = {}
+    for path, reason in problems:
+        merged[path] = f"{merged[path]}; {reason}" if path in merged else reason
+    return list(merged.items())
+
+
+def drop_bullets(data, problems):
+    """Remove stories whose bullets still fail, if enough stories remain.
+
+    Returns the number of stories removed.
+    """
+    indexes = set()
+    for path, _ in problems:
+        for key in BULLET_LISTS:
+            if path.startswith(key + '['):
+                indexes.add(int(path[len(key) + 1:-1]))
+    indexes = {i for i in indexes if i < len(data['bullets_long'])}
+    if not indexes or len(data['bullets_long']) - len(indexes) < MIN_BULLETS:
+        return 0
+    for key in BULLET_LISTS:
+        data[key] = [b for i, b in enumerate(data[key]) if i not in indexes]
+    return len(indexes)
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Record/replay stand-in for Google News RSS, plus a fetch-stage benchmark.
+
+    # Capture today's real feeds into a new fixture version
+    python .github/scripts/rss_replay.py record
+
+    # Serve fixtures (or synthetic feeds) locally and point the generator at it
+    python .github/scripts/rss_replay.py serve --port 8765 --latency 0.2 --error-rate 0.1
+    RSS_BASE_URL=http://127.0.0.1:8765 python .github/scripts/generate_article.py
+
+    # Fetch throughput, parse time and memory across synthetic feed sizes
+    python .github/scripts/rss_replay.py bench --items 50 500 5000
+
+    # Google News redirect resolution, first run vs. cached
+    python .github/scripts/rss_replay.py bench-links
+
+Fixtures live in .github/fixtures/rss/v<N>/, one <query>.xml per query plus
+a manifest.json recording when and from where they were captured.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+import urllib.request
+import zlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fixtures', 'rss')
+
+SOURCES = ['Reuters', 'BBC News', 'The Guardian', 'CNN', 'NBC News', 'Al Jazeera',
+           'The New York Times', 'Washington Post', 'Politico', 'Euronews']
+SUBJECTS = ['Ghislaine Maxwell', 'Les Wexner', 'Prince Andrew', 'Bill Gates', 'Jean-Luc Brunel',
+            'Epstein victims', 'Epstein survivors', 'Epstein estate', 'Flight log names']
+EVENTS = ['faces new lawsuit', 'named in unsealed files', 'appeal rejected', 'trafficking probe widens',
+          'testifies before committee', 'settlement reached', 'documents reveal new ties']
+
+
+def synthetic_feed(items, seed=0, max_age_hours=96, link_base='https://news.google.com'):
+    """A Google News-shaped RSS document with `items` deterministic entries."""
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+             '<title>"epstein" - Google News</title><link>https://news.google.com/</link>']
+    for i in range(items):
+        source = rnd.choice(SOURCES)
+        title = f"{rnd.choice(SUBJECTS)} {rnd.choice(EVENTS)} ({seed}-{i}) - {source}"
+        published = now - timedelta(minutes=rnd.randint(10, max_age_hours * 60))
+        parts.append(
+            f'<item><title>{escape(title)}</title>'
+            f'<link>{link_base}/rss/articles/CBMi{seed}x{i}?oc=5</link>'
+            f'<guid isPermaLink="false">CBMi{seed}x{i}</guid>'
+            f'<pubDate>{format_datetime(published)}</pubDate>'
+            f'<description>{escape(title)}</description>'
+            f'<source url="https://{source.lower().replace(" ", "")}.com">{escape(source)}</source></item>')
+    parts.append('</channel></rss>')
+    return ''.join(parts).encode('utf-8')
+
+
+def load_fixtures(version=None):
+    """Return {query: body} for a fixture version (latest if None)."""
+    if not os.path.isdir(FIXTURES_DIR):
+        return {}
+    versions = sorted((d for d in os.listdir(FIXTURES_DIR) if d.startswith('v') and d[1:].isdigit()),
+                      key=lambda d: int(d[1:]))
+    if not versions:
+        return {}
+    directory = os.path.join(FIXTURES_DIR, version or versions[-1])
+    fixtures = {}
+    for name in os.listdir(directory):
+        if name.endswith('.xml'):
+            with open(os.path.join(directory, name), 'rb') as f:
+                fixtures[urllib.parse.unquote(name[:-len('.xml')])] = f.read()
+    return fixtures
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real host
+
+    def do_GET(self):
+        server = self.server
+        parts = urllib.parse.urlsplit(self.path)
+        if parts.path.startswith('/rss/articles/'):
+            self.redirect_article(parts.path.rsplit('/', 1)[-1])
+            return
+        if parts.path != '/rss/search':
+            self.send_error(404)
+            return
+        query = urllib.parse.quote_plus(urllib.parse.parse_qs(parts.query).get('q', [''])[0], safe='')
+
+        with server.lock:
+            server.requests += 1
+            delay = server.latency + server.rng.uniform(0, server.jitter)
+            fail = server.rng.random() < server.error_rate
+        time.sleep(delay)
+        if fail:
+            self.send_error(503)
+            return
+
+        body = server.fixtures.get(query)
+        if body is None:
+            body = server.synthetic.get(query)
+            if body is None:
+                body = synthetic_feed(server.items, seed=int(hashlib.sha1(query.encode()).hexdigest()[:8], 16),
+                                      link_base=server.base_url)
+                server.synthetic[query] = body
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml; charset=utf-8')
+        self.send_header('ETag', etag)
+        if server.compress and 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            body = gzip.compress(body, compresslevel=6, mtime=0)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_HEAD = do_GET
+
+    def redirect_article(self, article_id):
+        """Stand in for Google's article redirect with a 302 to a publisher URL."""
+        with self.server.lock:
+            self.server.redirects += 1
+        source = SOURCES[zlib.crc32(article_id.encode()) % len(SOURCES)]
+        self.send_response(302)
+        self.send_header('Location', f"https://www.{source.lower().replace(' ', '')}.com/news/{article_id}")
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(fixtures=None, items=100, latency=0.0, jitter=0.0, error_rate=0.0, port=0, seed=0,
+                 compress=True):
+    """Start the stand-in on a background thread; returns (server, base_url)."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), ReplayHandler)
+    server.daemon_threads = True
+    server.fixtures = fixtures or {}
+    server.synthetic = {}
+    server.items = items
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.compress = compress
+    server.rng = random.Random(seed)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.redirects = 0
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.base_url
+
+
+def record(args):
+    from generate_article import RSS_QUERIES, RSS_USER_AGENT
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    existing = [int(d[1:]) for d in os.listdir(FIXTURES_DIR) if d.startswith('v') and d[1:].isdigit()]
+    directory = os.path.join(FIXTURES_DIR, f"v{max(existing, default=0) + 1}")
+    os.makedirs(directory)
+
+    recorded = []
+    for query in RSS_QUERIES:
+        url = f"{args.base_url}/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+        try:
+            req = urllib.request.Request(url, headers={'User-Agent': RSS_USER_AGENT})
+            with urllib.request.urlopen(req, timeout=30) as response:
+                body = response.read()
+        except Exception as e:
+            print(f"Error recording {query}: {e}")
+            continue
+        with open(os.path.join(directory, urllib.parse.quote(query, safe='+') + '.xml'), 'wb') as f:
+            f.write(body)
+        recorded.append({'query': query, 'bytes': len(body)})
+        print(f"Recorded {query} ({len(body) / 1024:.1f} KB)")
+
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump({'recorded_at': datetime.now(timezone.utc).isoformat(), 'base_url': args.base_url,
+                   'queries': recorded}, f, indent=2)
+    print(f"Saved {len(recorded)} feeds to {directory}")
+
+
+def serve(args):
+    fixtures = {} if args.synthetic else load_fixtures(args.version)
+    server, base_url = start_server(fixtures, items=args.items, latency=args.latency, jitter=args.jitter,
+                                    error_rate=args.error_rate, port=args.port, compress=not args.no_gzip)
+    source = 'synthetic feeds' if not fixtures else f"{len(fixtures)} fixtures"
+    print(f"Serving {source} at {base_url} (RSS_BASE_URL={base_url}); Ctrl-C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+def bench(args):
+    import tracemalloc
+    import xml.etree.ElementTree as ET
+
+    # Benchmark the fetch path itself, not the cache or item store
+    os.environ['RSS_CACHE'] = '0'
+    os.environ['NEWS_STORE'] = '0'
+    import generate_article
+    from http_pool import HTTPPool
+
+    cutoff = datetime.now().astimezone() - timedelta(hours=generate_article.RSS_MAX_AGE_HOURS)
+    rows = []
+    for items in args.items:
+        server, base_url = start_server(items=items, latency=args.latency, jitter=args.jitter,
+                                        compress=not args.no_gzip)
+        generate_article.RSS_BASE_URL = base_url
+        pool = generate_article.http_pool = HTTPPool(max_idle_per_host=generate_article.RSS_PER_HOST_LIMIT)
+        try:
+            started = time.perf_counter()
+            results = generate_article.fetch_all_feeds(generate_article.RSS_QUERIES)
+            fetch_seconds = time.perf_counter() - started
+        finally:
+            server.shutdown()
+            server.server_close()
+        parsed = sum(len(r or []) for r in results)
+
+        body = synthetic_feed(items, seed=1)
+        chunk = generate_article.RSS_CHUNK_SIZE
+        chunks = [body[i:i + chunk] for i in range(0, len(body), chunk)]
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            generate_article.parse_feed_stream(iter(chunks), cutoff)
+        parse_ms = (time.perf_counter() - started) / args.repeat * 1000
+        stream_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        ET.fromstring(body.decode('utf-8')).findall('.//item')
+        tree_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        rows.append(f"{items:>6} {len(body) / 1024:>8.1f} {pool.bytes_wire / len(results) / 1024:>8.1f} "
+                    f"{pool.connections_opened:>6} {fetch_seconds:>8.2f} "
+                    f"{len(results) / fetch_seconds:>8.1f} {parsed / fetch_seconds:>9.0f} "
+                    f"{parse_ms:>9.1f} {stream_peak / 1024:>15.0f} {tree_peak / 1024:>19.0f}")
+        pool.close()
+
+    print(f"\n{'items':>6} {'KB/feed':>8} {'wire KB':>8} {'conns':>6} {'fetch s':>8} {'feeds/s':>8} "
+          f"{'items/s':>9} {'parse ms':>9} {'stream peak KB':>15} {'fromstring peak KB':>19}")
+    print('\n'.join(rows))
+
+
+def bench_links(args):
+    """Cold vs. warm redirect resolution against the local stand-in."""
+    import tempfile
+    from http_pool import HTTPPool
+    from link_resolver import LinkResolver
+
+    server, base_url = start_server(latency=args.latency, jitter=args.jitter)
+    host = urllib.parse.urlsplit(base_url).netloc
+    urls = [f"{base_url}/rss/articles/CBMi0x{i}?oc=5" for i in range(args.links)]
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = HTTPPool(max_idle_per_host=args.workers)
+            resolver = LinkResolver(os.path.join(tmp, 'links'), {host}, 'rss-replay-bench',
+                                    workers=args.workers, pool=pool)
+            for label in ('cold', 'warm'):
+                before = server.redirects
+                started = time.perf_counter()
+                mapping = resolver.resolve_all(urls)
+                elapsed = time.perf_counter() - started
+                off_host = sum(1 for u in urls if urllib.parse.urlsplit(mapping.get(u, u)).netloc != host)
+                print(f"{label}: {elapsed:.3f}s, {server.redirects - before} redirect requests, "
+                      f"{off_host}/{len(urls)} links now point at publishers")
+            pool.report('Link resolver')
+            pool.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline Google News RSS stand-in and fetch benchmark.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('record', help='capture live feeds into a new fixture version')
+    p.add_argument('--base-url', default='https://news.google.com')
+    p.set_defaults(func=record)
+
+    p = sub.add_parser('serve', help='serve fixtures or synthetic feeds over HTTP')
+    p.add_argument('--port', type=int, default=8765)
+    p.add_argument('--version', help='fixture version, e.g. v2 (default: latest)')
+    p.add_argument('--synthetic', action='store_true', help='ignore fixtures, generate feeds')
+    p.add_argument('--items', type=int, default=100, help='items per synthetic feed')
+    p.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    p.add_argument('--jitter', type=float, default=0.0, help='random extra latency, in seconds')
+    p.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered 503')
+    p.add_argument('--no-gzip', action='store_true', help='never compress responses')
+    p.set_defaults(func=serve)
+
+    p = sub.add_parser('bench', help='measure fetch throughput, parse time and memory')
+    p.add_argument('--items', type=int, nargs='+', default=[50, 500, 5000])
+    p.add_argument('--latency', type=float, default=0.05)
+    p.add_argument('--jitter', type=float, default=0.05)
+    p.add_argument('--repeat', type=int, default=5, help='parse iterations per size')
+    p.add_argument('--no-gzip', action='store_true', help='serve uncompressed feeds')
+    p.set_defaults(func=bench)
+
+    p = sub.add_parser('bench-links', help='measure redirect resolution, cold and cached')
+    p.add_argument('--links', type=int, default=200)
+    p.add_argument('--workers', type=int, default=8)
+    p.add_argument('--latency', type=float, default=0.05)
+    p.add_argument('--jitter', type=float, default=0.05)
+    p.set_defaults(func=bench_links)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Per-stage timing and memory report for the daily pipeline.
+
+    report = RunReport()
+    with report.stage('fetch') as span:
+        articles = fetch_news_from_rss()
+        span.items = len(articles)
+    report.write('run_report.json')
+
+Each stage records wall time, CPU time, the process's peak RSS and how
+much it grew during the stage, plus an item count. Optional extras:
+
+    RUN_TRACEMALLOC=1     also record the peak Python heap per stage
+                          (slower, so off by default)
+    RUN_PROFILE_DIR=dir   dump a cProfile of each stage to dir/<stage>.prof
+                          (main thread only; worker threads are not profiled)
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from fileutil import write_atomic
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class Span:
+    def __init__(self, name):
+        self.name = name
+        self.items = None
+        self.extra = {}
+
+
+class RunReport:
+    def __init__(self, **meta):
+        self.meta = meta
+        self.started = datetime.now(timezone.utc)
+        self.wall_start = time.perf_counter()
+        self.stages = []
+        self.status = 'running'
+        self.trace_memory = os.environ.get('RUN_TRACEMALLOC') == '1'
+        self.profile_dir = os.environ.get('RUN_PROFILE_DIR')
+
+    @contextmanager
+    def stage(self, name):
+        span = Span(name)
+        record = {'stage': name}
+        profiler = None
+        if self.profile_dir:
+            import cProfile
+            profiler = cProfile.Profile()
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+
+        rss_before = _peak_rss_mb()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield span
+            record['status'] = 'ok'
+        except BaseException as e:
+            record['status'] = 'error'
+            record['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if profiler:
+                profiler.disable()
+            record['wall_s'] = round(time.perf_counter() - wall, 4)
+            record['cpu_s'] = round(time.process_time() - cpu, 4)
+            record['peak_rss_mb'] = round(_peak_rss_mb(), 1)
+            record['rss_growth_mb'] = round(_peak_rss_mb() - rss_before, 1)
+            if self.trace_memory:
+                record['py_heap_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+            if span.items is not None:
+                record['items'] = span.items
+            record.update(span.extra)
+            if profiler:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                path = os.path.join(self.profile_dir, f"{name}.prof")
+                profiler.dump_stats(path)
+                record['profile'] = path
+            self.stages.append(record)
+            print(f"  [{name}] {record['wall_s']:.2f}s wall, {record['cpu_s']:.2f}s CPU, "
+                  f"peak RSS {record['peak_rss_mb']:.0f} MB")
+
+    def as_dict(self):
+        return {
+            **self.meta,
+            'started': self.started.isoformat(timespec='seconds'),
+            'status': self.status,
+            'total_wall_s': round(time.perf_counter() - self.wall_start, 4),
+            'stages': self.stages,
+        }
+
+    def write(self, path):
+        write_atomic(path, json.dumps(self.as_dict(), indent=2))
+        print(f"Run report written to {path}")
@@ -0,0 +1,194 @@
+"""
+Incremental, tolerant parser for a JSON object streamed from Claude.
+
+The response arrives as text chunks, possibly wrapped in a ```json fence
+or preceded by a sentence of prose. IncrementalJSONParser scans each chunk
+once, skipping everything before the first '{' and after the matching '}',
+and reports values as soon as they are complete. Prose can contain braces
+too ("Here is {the} result: ```json ..."), so a candidate object that hits
+a backtick outside a string, or closes but does not parse, is dropped and
+scanning restarts after it. A ```json fenced object found after the one
+parsed is preferred in result().
+
+
+    on_field(key, value)        a top-level member, e.g. theme_headline
+    on_item(key, index, value)  an object inside a top-level array, e.g.
+                                bullets_long[2] (None if it does not parse)
+
+result() returns the whole object. Output that is malformed gets the usual
+regex repairs; output that was cut off is closed at the last complete
+value, so the caller can see exactly which parts are missing and ask for
+just those.
+"""
+
+import json
+import re
+
+
+class IncrementalJSONParser:
+    def __init__(self, on_field=None, on_item=None):
+        self.on_field = on_field
+        self.on_item = on_item
+        self.text = ''
+        self.pos = 0
+        self.root_start = None
+        self.root_end = None
+        self.stack = []  # open containers: {'type', 'start', 'key', 'after_colon', 'count'}
+        self.in_string = False
+        self.escape = False
+        self.string_start = None
+        self.last_string = None
+        self.safe = None  # (end offset, open container types) of the last complete value
+        self.repaired = False
+
+    @property
+    def done(self):
+        return self.root_end is not None
+
+    def feed(self, chunk):
+        self.text += chunk
+        text = self.text
+        i = self.pos
+        while i < len(text) and self.root_end is None:
+            c = text[i]
+            i += 1
+            if self.root_start is None:
+                if c == '{':
+                    self.root_start = i - 1
+                    self._open(c, i - 1)
+                continue
+            at = i - 1
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif c == '\\':
+                    self.escape = True
+                elif c == '"':
+                    self.in_string = False
+                    self._string_done(at)
+                continue
+            if c == '"':
+                self.in_string = True
+                self.string_start = at
+            elif c in '{[':
+                self._open(c, at)
+            elif c in '}]':
+                self._close(at)
+                if self.root_end is not None and self._parse_root()[0] is None:
+                    self._restart()  # a brace in prose, e.g. "Here is {the} result"
+            elif c == ',' and self.stack:
+                self.stack[-1]['after_colon'] = False
+                self._mark_safe(at)
+            elif c == ':' and self.stack:
+                self.stack[-1]['after_colon'] = True
+                self.stack[-1]['key'] = self.last_string
+            elif c == '`':
+                self._restart()  # never valid outside a JSON string: the fence after some prose
+        self.pos = i
+
+    def strip_trailing_whitespace(self):
+        """Drop trailing whitespace so the text can be used as an assistant prefill.
+
+        Claude continues a prefill from its stripped end, so the whitespace
+        must not stay in the buffer. It carries no scanner state.
+        """
+        self.text = self.text.rstrip()
+        self.pos = min(self.pos, len(self.text))
+        return self.text
+
+    def _restart(self):
+        """Drop the current candidate object; scanning resumes at the next '{'."""
+        self.root_start = self.root_end = None
+        self.stack = []
+        self.in_string = self.escape = False
+        self.last_string = None
+        self.safe = None
+
+    def _open(self, c, i):
+        self.stack.append({'type': c, 'start': i, 'key': None, 'after_colon': False, 'count': 0})
+
+    def _mark_safe(self, end):
+        self.safe = (end, [s['type'] for s in self.stack])
+
+    def _is_value_position(self):
+        top = self.stack[-1]
+        return top['type'] == '[' or top['after_colon']
+
+    def _string_done(self, i):
+        try:
+            value = json.loads(self.text[self.string_start:i + 1])
+        except ValueError:
+            value = self.text[self.string_start + 1:i]
+        self.last_string = value
+        if self._is_value_position():
+            self._mark_safe(i + 1)
+            if len(self.stack) == 1 and self.on_field:
+                self.on_field(self.stack[0]['key'], value)
+
+    def _close(self, i):
+        opened = self.stack.pop()
+        if not self.stack:
+            self.root_end = i
+            self._mark_safe(i + 1)
+            return
+        self._mark_safe(i + 1)
+        parent = self.stack[-1]
+        raw = self.text[opened['start']:i + 1]
+        if len(self.stack) == 1 and self.on_field:
+            try:
+                self.on_field(parent['key'], json.loads(raw))
+            except ValueError:
+                pass
+        elif len(self.stack) == 2 and parent['type'] == '[' and opened['type'] == '{':
+            index = parent['count']
+            parent['count'] += 1
+            if self.on_item:
+                try:
+                    value = json.loads(raw)
+                except ValueError:
+                    value = None
+                self.on_item(self.stack[0]['key'], index, value)
+
+    def _parse_root(self):
+        """Parse the closed root object as (value, repaired); value is None if that fails."""
+        raw = self.text[self.root_start:self.root_end + 1]
+        try:
+            return json.loads(raw), False
+        except json.JSONDecodeError:
+            pass
+        # Fix trailing commas before } or ]
+        repaired = re.sub(r',\s*([}\]])', r'\1', raw)
+        # Fix missing commas between objects/strings
+        repaired = re.sub(r'"\s*\n\s*"', '",\n"', repaired)
+        repaired = re.sub(r'}\s*\n\s*{', '},\n{', repaired)
+        try:
+            return json.loads(repaired), True
+        except json.JSONDecodeError:
+            return None, True
+
+    def result(self):
+        """Return the parsed object, repairing or closing it if needed (None if hopeless)."""
+        if self.root_start is None:
+            return None
+        if self.done:
+            fence = self.text.find('```json', self.root_end)
+            if fence != -1:
+                # The object so far was prose; the fenced one is the answer
+                fenced = IncrementalJSONParser()
+                fenced.feed(self.text[fence:])
+                value = fenced.result()
+                if value is not None:
+                    self.repaired = fenced.repaired
+                    return value
+            value, self.repaired = self._parse_root()
+            return value
+        # Cut off mid-response: close every open container after the last complete value
+        self.repaired = True
+        if self.safe is None:
+            return None
+        end, types = self.safe
+        closers = ''.join('}' if t == '{' else ']' for t in reversed(types))
+        try:
+            return json.loads(self.text[self.root_start:end] + closers)
+        except json.JSONDecodeError:
+            return None
@@ -5,11 +5,14 @@ Creates articles for Jan 30 - Feb 8, 2026
 """
 
 import os
-import random
+import sys
 import urllib.parse
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '.github', 'scripts'))
+from paper_texture import paper_texture
+
 # Article data for each day
 ARTICLES = {
     "2026-01-30": {
@@ -131,31 +134,8 @@ def generate_thumbnail(date_obj, headline, filename, vol_num):
     day_name = date_obj.strftime('%A')
     date_str = f"{day_name}, {date_obj.strftime('%B')} {date_obj.day}, {date_obj.year}"
 
-    img = Image.new('RGB', (WIDTH, HEIGHT), '#f4ead5')
-    draw = ImageDraw.Draw(img)
-    pixels = img.load()
-
-    # Add paper texture - noise
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            r, g, b = pixels[x, y]
-            noise = random.randint(-8, 8)
-            edge_dist = min(x, WIDTH-x, y, HEIGHT-y)
-            edge_darken = max(0, 15 - edge_dist // 8)
-            r = max(0, min(255, r + noise - edge_darken))
-            g = max(0, min(255, g + noise - edge_darken - 3))
-            b = max(0, min(255, b + noise - edge_darken - 8))
-            pixels[x, y] = (r, g, b)
-
-    # Add vignette
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            r, g, b = pixels[x, y]
-            cx, cy = WIDTH // 2, HEIGHT // 2
-            dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-            max_dist = ((cx) ** 2 + (cy) ** 2) ** 0.5
-            vignette = 1 - (dist / max_dist) * 0.15
-            pixels[x, y] = (int(r * vignette), int(g * vignette), int(b * vignette))
+    # Paper texture: noise, darkened edges and a vignette
+    img = paper_texture(Image.new('RGB', (WIDTH, HEIGHT), '#f4ead5'))
 
     draw = ImageDraw.Draw(img)
     ink = '#1a1816'